@@ -0,0 +1,56 @@
+import logging
+import logging.config
+import os
+import queue
+from logging.handlers import QueueListener
+
+import structlog
+
+
+def configure_logging() -> QueueListener:
+    """
+    Configure stdlib logging and structlog once for the whole app.
+    Returns the queue listener that does the actual writes; start and stop it
+    with the app.
+    """
+    level = os.getenv("LOG_LEVEL", "INFO")
+
+    # Request handlers only enqueue records; a listener thread does the actual writes
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        respect_handler_level=True
+    )
+
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "queue": {
+                "class": "logging.handlers.QueueHandler",
+                "queue": log_queue,
+            },
+        },
+        "root": {
+            "level": level,
+            "handlers": ["queue"],
+        },
+    })
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer()
+        ],
+        # Calls below LOG_LEVEL are no-ops instead of running the processor chain
+        wrapper_class=structlog.make_filtering_bound_logger(level.lower()),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    return log_listener
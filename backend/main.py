@@ -1,16 +1,31 @@
+import asyncio
 import os
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
-from routes.clone import clone_router
+from logging_config import configure_logging
+from routes.clone import clone_router, open_clone_clients, close_clone_clients, warm_sentence_cache
 from routes.ws_audio_ads import ws
+from utils.gpt_utils.gpts import close_openai_clients
+from utils.http_client import close_shared_client
+from utils.mixer_utils.audio_mixer import shutdown_worker_pool
+from utils.musicgen_utils.musicgen import close_music_clients
+from utils.speech_generator_utils.speech_generator import close_http_client
+from utils.ws_utils.handlers import context_cache
 
 load_dotenv()
 
-app = FastAPI()
+log_listener = configure_logging()
 
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# FRONTEND_ORIGIN may hold several comma-separated origins. "*" is never allowed
+# since it's invalid alongside allow_credentials=True.
 origins = [
-    os.getenv("FRONTEND_ORIGIN", "http://localhost:3000")
+    origin.strip()
+    for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip() and origin.strip() != "*"
 ]
 
 app.add_middleware(
@@ -24,6 +39,31 @@ app.add_middleware(
 app.include_router(clone_router, prefix="/api/clones")
 app.include_router(ws, prefix="/ws/ads")
 
+warm_languages = [
+    lang.strip()
+    for lang in os.getenv("WARM_SENTENCE_LANGUAGES", "ES,FR,DE,IT,PT-BR").split(",")
+    if lang.strip()
+]
+
+@app.on_event("startup")
+async def startup():
+    log_listener.start()
+    await open_clone_clients()
+    # Run in the background so startup doesn't wait on DeepL
+    app.state.warm_task = asyncio.create_task(warm_sentence_cache(warm_languages))
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.warm_task.cancel()
+    await close_clone_clients()
+    await close_http_client()
+    await close_openai_clients()
+    await close_shared_client()
+    await context_cache.close()
+    await close_music_clients()
+    shutdown_worker_pool()
+    log_listener.stop()
+
 @app.get("/api/health")
 def health_check():
     """Health check endpoint for monitoring or CronJobs."""
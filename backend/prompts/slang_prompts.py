@@ -1,5 +1,4 @@
-def system_prompt():
-    return """
+_SLANG_SYSTEM_PROMPT = """
 You are a cultural linguistics research assistant specializing in contemporary slang and colloquial expressions.
 
 ## **TASK:**
@@ -50,6 +49,10 @@ You will receive a JSON object:
 - Cite reliability of sources when uncertain
 """
 
+
+def system_prompt():
+    return _SLANG_SYSTEM_PROMPT
+
 def user_prompt(country: str, max_results: int = 10, ) -> dict:
     data = {
         "country": country,
@@ -1,69 +1,124 @@
 import logging
 import random
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+import sys
+import time
+from typing import Iterable, List, Optional
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from schemas.clone_schemas import ReservationResponse, CloningSentencesResponse
-from utils.redis_utils import VoiceSlotManager
+from utils.redis_utils import SentenceCache, slot_manager
 from utils.constants import cloning_sentences
-from utils.deepl_utils import translate
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Dedicated generator so /sentences doesn't share state with the global random module
+_rng = random.Random()
+
+# English samples are drawn from a seed fixed for this many seconds, so the
+# ETag (the seed) stays valid for as long as clients may reuse the response
+_SAMPLE_WINDOW = 30
+
+# Shared across requests so every handler reuses the same Redis connection pool
+_sentence_cache = SentenceCache()
+
 clone_router = APIRouter()
 
+
+async def get_translated_corpus(language: str) -> Optional[List[str]]:
+    """
+    Get the whole training corpus in `language`, translating and caching it
+    in Redis on first use so later requests skip DeepL entirely.
+    """
+    cached = await _sentence_cache.get_sentences(language)
+    if cached:
+        return cached
+
+    # The DeepL SDK is only needed on a cache miss, so don't load it at boot
+    from utils.deepl_batcher import batcher
+
+    translated = await batcher.translate(list(cloning_sentences), "EN-US", language)
+    if translated:
+        await _sentence_cache.set_sentences(language, translated)
+    return translated
+
+
+async def open_clone_clients():
+    """Connect the shared Redis clients ahead of the first request"""
+    try:
+        await slot_manager.initialize()
+        await _sentence_cache.initialize()
+    except Exception as e:
+        logger.warning("Redis unavailable at startup, will connect on first use: %s", e)
+
+
+async def close_clone_clients():
+    """Close the shared Redis clients and stop the DeepL batcher and workers"""
+    await slot_manager.close()
+    await _sentence_cache.close()
+
+    deepl_batcher = sys.modules.get("utils.deepl_batcher")
+    if deepl_batcher:
+        await deepl_batcher.batcher.close()
+
+    deepl_utils = sys.modules.get("utils.deepl_utils")
+    if deepl_utils:
+        deepl_utils.shutdown_executor()
+
+
+async def warm_sentence_cache(languages: Iterable[str]):
+    """Pre-translate the training corpus for commonly requested languages"""
+    for language in languages:
+        if await get_translated_corpus(language.upper()):
+            logger.info("Training sentences cached for %s", language.upper())
+
+
 @clone_router.post("/reservations/create", response_model=ReservationResponse)
 async def create_slot_reservation():
     try:
-        slot_manager = VoiceSlotManager()
-        is_available = await slot_manager.has_available_slot()
+        reservation_id = await slot_manager.reserve_slot_atomic()
 
-        if not is_available:
-            return JSONResponse(
+        if not reservation_id:
+            return ORJSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"created": False, "detail": "No available slots"}
             )
         
-        reservation_id = await slot_manager.reserve_slot()
-
-        if not reservation_id:
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={"created": False, "detail": "Failed to reserve slot"}
-            )
-        
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"reservation_id": reservation_id, "created": True}
         )
     except Exception as e:
-        logger.error(f"Error creating Reservation: {e}")
+        logger.error("Error creating Reservation: %s", e)
         raise HTTPException(status_code=500, detail="Error creating Reservation")
     
-@clone_router.get("/sentences", response_model=CloningSentencesResponse)
-async def get_voice_training_sentences(language_code: str):
+@clone_router.get("/sentences", responses={200: {"model": CloningSentencesResponse}})
+async def get_voice_training_sentences(language_code: str, request: Request):
     try:
-        sentences = random.sample(cloning_sentences, 5)
-        sentence_string = "\n\n".join(sentences)
         if language_code.lower() == "en":
-            return {
+            window = int(time.time()) // _SAMPLE_WINDOW
+            etag = f'"en-{window}"'
+            # Let clients reuse a sample briefly instead of refetching on retries/remounts
+            headers = {"ETag": etag, "Cache-Control": f"private, max-age={_SAMPLE_WINDOW}"}
+
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            sentences = random.Random(window).sample(cloning_sentences, 5)
+            return ORJSONResponse({
                 "sentences": sentences,
                 "language": "EN"
-            }
+            }, headers=headers)
         
-        translated_str: str = await translate(
-            sentence_string, 
-            "EN-US", 
-            language_code.upper()
-        )
+        corpus = await get_translated_corpus(language_code.upper())
+        translated_sentences = _rng.sample(corpus, 5) if corpus else None
         
-        if not translated_str:
+        if not translated_sentences:
             raise HTTPException(status_code=500, detail="Error translating sentences to target language")
 
-        return {
-            "sentences": translated_str.split("\n\n"),
+        return ORJSONResponse({
+            "sentences": translated_sentences,
             "language": language_code.upper()
-        } 
+        })
     except Exception as e:
-        logger.error(f"Error getting voice training sentences: {e}")
+        logger.error("Error getting voice training sentences: %s", e)
         raise HTTPException(status_code=500, detail="Error getting voice training sentences")
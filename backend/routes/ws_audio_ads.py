@@ -1,13 +1,13 @@
 import asyncio
-import json
 import logging
-from typing import Optional
+from typing import Awaitable, Optional
 from fastapi import WebSocket, APIRouter
+import orjson
 
 from schemas.speech_generator_schemas import VoiceData
 from schemas.ws_schemas import AdRequest
 
-from utils.redis_utils import VoiceSlotManager
+from utils.redis_utils import slot_manager
 from utils.speech_generator_utils.speech_generator import create_speech_generator
 from utils.ws_utils.dataclasses import AdProcessingState, StepResult, StepStatus
 from utils.ws_utils.steps.insights import step_gather_insights
@@ -16,22 +16,77 @@ from utils.ws_utils.steps.music import step_generate_music
 from utils.ws_utils.steps.speech import step_generate_speech
 from utils.ws_utils.steps.transcript import step_generate_transcript
 from utils.ws_utils.ws_helpers import (
+    cork,
     ensure_voice_data_object, 
     safe_send_websocket_message, 
+    send_websocket_bytes,
     cleanup_custom_voice,
     get_dual_audio_message_bytes)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 ws = APIRouter()
 
+# Upper bounds for the external speech/music calls of a single ad, in seconds
+SPEECH_TIMEOUT = 120
+MUSIC_TIMEOUT = 180
+
+
+class StepFailedError(Exception):
+    """Raised inside the speech/music TaskGroup to cancel the sibling step."""
+
+    def __init__(self, result: StepResult):
+        super().__init__(result.error)
+        self.result = result
+
+
+async def _run_required_step(
+    websocket: WebSocket,
+    state: AdProcessingState,
+    step_name: str,
+    timeout: float,
+    step: Awaitable[StepResult]
+) -> StepResult:
+    """Run a step with a timeout, raising StepFailedError if it doesn't succeed."""
+    try:
+        async with asyncio.timeout(timeout):
+            result = await step
+    except TimeoutError:
+        await safe_send_websocket_message(websocket, {
+            "type": "error",
+            "index": state.index,
+            "step": step_name,
+            "message": f"{step_name.capitalize()} generation timed out"
+        })
+        result = StepResult(StepStatus.FAILED, error="Timed out", step_name=step_name)
+
+    if result.status == StepStatus.FAILED:
+        raise StepFailedError(result)
+    return result
+
+
+def _task_step_result(task: asyncio.Task, step_name: str) -> StepResult:
+    """Turn a finished TaskGroup task into the StepResult recorded on the state."""
+    if task.cancelled():
+        return StepResult(
+            StepStatus.SKIPPED,
+            error="Cancelled after a concurrent step failed",
+            step_name=step_name
+        )
+    if isinstance(task.exception(), StepFailedError):
+        return task.exception().result
+    if task.exception():
+        return StepResult(StepStatus.FAILED, error=str(task.exception()), step_name=step_name)
+    return task.result()
+
 async def process_ad_with_granular_handling(
     websocket: WebSocket, 
     index: int, 
     data: AdRequest, 
-    voices: list[VoiceData],
-    recordings: list[bytes]
+    voices_dumped: list[dict],
+    recordings: list[bytes],
+    voices_by_name: dict[str, VoiceData],
+    default_voice: Optional[VoiceData]
 ):
     """Process ad with granular error handling and status tracking."""
     location = data.locations[index]
@@ -49,7 +104,6 @@ async def process_ad_with_granular_handling(
     )
 
     voice_id: Optional[str] = None
-    slot_manager = VoiceSlotManager()
 
     try:
         # Step 1: Handle voice cloning if needed
@@ -103,7 +157,7 @@ async def process_ad_with_granular_handling(
 
         # Step 3: Generate transcript
         state.transcript = await step_generate_transcript(
-            websocket, state, data, voices, state.insights.data
+            websocket, state, data, voices_dumped, state.insights.data
         )
 
         if state.transcript.status == StepStatus.FAILED:
@@ -112,94 +166,94 @@ async def process_ad_with_granular_handling(
         # Prepare voice data
         if not voice_data:
             voice_model = state.transcript.data.results[0].voice_model.lower()
-            voice_dict = next(
-                (v for v in voices if v.voice_name.lower() == voice_model),
-                voices[-1] if voices else None
+            voice_data = ensure_voice_data_object(
+                voices_by_name.get(voice_model, default_voice)
             )
-            voice_data = ensure_voice_data_object(voice_dict)
 
-        # Step 4 & 5: Generate speech and music concurrently
-        speech_task = asyncio.create_task(
-            step_generate_speech(websocket, state, state.transcript.data, voice_data)
-        )
-        music_task = asyncio.create_task(
-            step_generate_music(
-                websocket, state, 
-                state.transcript.data.results[0].music_prompt
-            )
-        )
-
-        # Wait for both and handle partial failures
-        speech_result, music_result = await asyncio.gather(
-            speech_task, music_task, return_exceptions=True
-        )
+        # Step 4 & 5: Generate speech and music concurrently. The ad is useless
+        # if either fails, so the TaskGroup cancels the other one straight away
+        try:
+            async with asyncio.TaskGroup() as tg:
+                speech_task = tg.create_task(_run_required_step(
+                    websocket, state, "speech", SPEECH_TIMEOUT,
+                    step_generate_speech(websocket, state, state.transcript.data, voice_data)
+                ))
+                music_task = tg.create_task(_run_required_step(
+                    websocket, state, "music", MUSIC_TIMEOUT,
+                    step_generate_music(
+                        websocket, state, 
+                        state.transcript.data.results[0].music_prompt
+                    )
+                ))
+        except* StepFailedError:
+            pass
 
-        # Handle speech result
-        if isinstance(speech_result, Exception):
-            state.speech = StepResult(
-                StepStatus.FAILED, 
-                error=str(speech_result), 
-                step_name="speech"
-            )
-        else:
-            state.speech = speech_result
-
-        # Handle music result  
-        if isinstance(music_result, Exception):
-            state.music = StepResult(
-                StepStatus.FAILED,
-                error=str(music_result),
-                step_name="music"
-            )
-        else:
-            state.music = music_result
+        state.speech = _task_step_result(speech_task, "speech")
+        state.music = _task_step_result(music_task, "music")
 
-        # Step 6: Merge audio only if both speech and music succeeded
-        if (state.speech.status == StepStatus.SUCCESS and 
-            state.music.status == StepStatus.SUCCESS):
-            
-            state.merge = await step_merge_audio(
-                websocket, state, state.speech.data["audio_buffer"], state.music.data
-            )
-            
-            # After merge succeeds, send BOTH audio versions in a single message
-            if state.merge.status == StepStatus.SUCCESS:
-                combined_metadata = {
-                    "type": "audio_complete",
-                    "index": index,
-                    "transcript": state.speech.data["transcript"],
-                    "translations": state.speech.data["translations"],
-                    "alignments": state.speech.data["alignments"]
-                }
-                
-                speech_bytes = state.speech.data["audio_buffer"].getvalue()
-                merged_bytes = state.merge.data.getvalue()
+        try:
+            # Step 6: Merge audio only if both speech and music succeeded
+            if (state.speech.status == StepStatus.SUCCESS and 
+                state.music.status == StepStatus.SUCCESS):
                 
-                message_bytes = get_dual_audio_message_bytes(
-                    combined_metadata,
-                    speech_bytes,
-                    merged_bytes
+                state.merge = await step_merge_audio(
+                    websocket, state, state.speech.data["audio_buffer"], state.music.data
                 )
                 
-                await websocket.send_bytes(message_bytes)
-                logger.info(f"Sent combined audio message for index {index}")
-        else:
-            state.merge = StepResult(
-                StepStatus.SKIPPED,
-                error="Skipped due to speech or music failure",
-                step_name="merge"
-            )
+                # After merge succeeds, send BOTH audio versions in a single message
+                if state.merge.status == StepStatus.SUCCESS:
+                    try:
+                        alignments = await state.speech.data["alignments_task"]
+                    except Exception as e:
+                        logger.error(f"Forced alignment failed for index {index}: {e}")
+                        alignments = None
 
-        # Step 7: Voice cleanup
-        if data.ad_type == 'custom' and voice_id:
-            cleanup_status = 'completed' if state.merge.status == StepStatus.SUCCESS else 'error'
-            await cleanup_custom_voice(voice_id, slot_manager, cleanup_status)
-            state.voice_cleanup = StepResult(StepStatus.SUCCESS, step_name="voice_cleanup")
+                    combined_metadata = {
+                        "type": "audio_complete",
+                        "index": index,
+                        "transcript": state.speech.data["transcript"],
+                        "translations": state.speech.data["translations"],
+                        "alignments": alignments
+                    }
+                    
+                    speech_bytes = state.speech.data["audio_buffer"].getvalue()
+                    merged_bytes = state.merge.data.getvalue()
+                    
+                    message_bytes = get_dual_audio_message_bytes(
+                        combined_metadata,
+                        speech_bytes,
+                        merged_bytes
+                    )
+                    
+                    await send_websocket_bytes(websocket, message_bytes)
+                    logger.info(f"Sent combined audio message for index {index}")
+            else:
+                state.merge = StepResult(
+                    StepStatus.SKIPPED,
+                    error="Skipped due to speech or music failure",
+                    step_name="merge"
+                )
 
-        await safe_send_websocket_message(websocket, {
-            "type": "done",
-            "index": index
-        })
+            # Step 7: Voice cleanup
+            if data.ad_type == 'custom' and voice_id:
+                cleanup_status = 'completed' if state.merge.status == StepStatus.SUCCESS else 'error'
+                await cleanup_custom_voice(voice_id, slot_manager, cleanup_status)
+                state.voice_cleanup = StepResult(StepStatus.SUCCESS, step_name="voice_cleanup")
+
+            await safe_send_websocket_message(websocket, {
+                "type": "done",
+                "index": index
+            })
+        finally:
+            # Alignment runs in the background; stop it if it wasn't awaited
+            # (merge failed, speech/music failed, or an error above)
+            if state.speech.status == StepStatus.SUCCESS:
+                task = state.speech.data["alignments_task"]
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark a failure as retrieved so asyncio doesn't log it as unhandled
+                    task.exception()
 
     except Exception as e:
         logger.error(f"Unexpected error in process_ad for index {index}: {e}")
@@ -217,13 +271,12 @@ async def process_ad_with_granular_handling(
 @ws.websocket("/generate")
 async def generate_audio_ads(websocket: WebSocket):
     """Main websocket endpoint with granular error handling."""
-    print("Websocket activate")
     await websocket.accept()
 
     try:
         # Receive and validate initial request
-        data = await websocket.receive_json()
-        ad_request = AdRequest(**data)
+        # Validated straight from the raw JSON, without building an intermediate dict
+        ad_request = AdRequest.model_validate_json(await websocket.receive_text())
         
         if not ad_request.locations:
             raise ValueError("No locations provided")
@@ -240,9 +293,14 @@ async def generate_audio_ads(websocket: WebSocket):
         if not voices:
             raise ValueError("Failed to retrieve voices library")
 
+        # The library is fixed for the session, so index it once for every ad
+        # (built in reverse so the first voice wins on duplicate names, as before)
+        voices_by_name = {v.voice_name.lower(): v for v in reversed(voices)}
+        default_voice = voices[-1]
+        voices_dumped = [v.model_dump() for v in voices]
+
         # Validate slot reservation for custom ads
         if ad_request.ad_type == 'custom':
-            slot_manager = VoiceSlotManager()
             is_slot_available = await slot_manager.has_available_slot(
                 ad_request.slot_reservation_id
             )
@@ -259,7 +317,7 @@ async def generate_audio_ads(websocket: WebSocket):
                     if "bytes" in message:
                         music_buffers.append(message["bytes"])
                     elif "text" in message:
-                        json_data = json.loads(message["text"])
+                        json_data = orjson.loads(message["text"])
                         if json_data.get("type") == "finished":
                             break
                 else:
@@ -271,7 +329,12 @@ async def generate_audio_ads(websocket: WebSocket):
 
         # Process all locations with granular handling
         for i in range(len(ad_request.locations)):
-            await process_ad_with_granular_handling(websocket, i, ad_request, voices, music_buffers)
+            # Status messages for each ad are coalesced into as few frames as possible
+            async with cork(websocket, max_delay_ms=10, max_batch=32):
+                await process_ad_with_granular_handling(
+                    websocket, i, ad_request, voices_dumped, music_buffers,
+                    voices_by_name, default_voice
+                )
         
         await safe_send_websocket_message(websocket, {
             "type": "complete"
@@ -1,11 +1,16 @@
-from pydantic import BaseModel, ValidationInfo, Field, field_validator
+from pydantic import BaseModel, ConfigDict, ValidationInfo, Field, field_validator
 from typing import List, Optional
+from utils.normalize import norm_country
 
 class InsightDetail(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     insight: str
     explanation: str
 
 class ResultItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     voice_model: str
     music_prompt: str
     transcript: str
@@ -47,14 +52,13 @@ class SlangsResponse(BaseModel):
     sources: list[str]
 
 class SlangRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     country: str = Field(..., min_length=2, max_length=50)
     
     @field_validator('country')
     def validate_country(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Country cannot be empty")
-        
         if not v.replace(' ', '').isalpha():
             raise ValueError("Country name should contain only letters and spaces")
         
-        return v.strip().title()
\ No newline at end of file
+        return norm_country(v)
\ No newline at end of file
@@ -1,27 +1,20 @@
 import time
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NewsArticle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Stripped by the news client before the article is built
     title: str = Field(..., min_length=1, max_length=500)
     snippet: Optional[str] = Field(None, max_length=1000)
-    
-    @field_validator('title')
-    def validate_title(cls, v):
-        return v.strip() if v else ""
-    
-    @field_validator('snippet')
-    def validate_snippet(cls, v):
-        return v.strip() if v else None
 
 
 class NewsResponse(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     query: str = Field(..., min_length=1)
     articles: List[NewsArticle] = Field(default_factory=list)
     timestamp: float = Field(default_factory=time.time)
     request_id: Optional[str] = None
-    
-    @field_validator('query')
-    def validate_query(cls, v):
-        return v.strip()
\ No newline at end of file
@@ -1,33 +1,25 @@
 from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VoiceData(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     voice_name: str = Field(..., min_length=1, max_length=100)
     voice_id: str = Field(..., min_length=1)
     description: Optional[str] = None
     labels: Optional[Dict[str, Any]] = None
     category: Optional[str] = None
-    
-    @field_validator('voice_name')
-    def validate_voice_name(cls, v):
-        return v.strip()
 
 
 class SpeechRequest(BaseModel):
+    # Stripped before the length checks, so blank text is rejected by min_length.
+    # 50000 characters is at most 200KB of UTF-8, so no separate byte check is needed.
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     text: str = Field(..., min_length=1, max_length=50000)
     voice_id: str = Field(..., min_length=1)
     speed: float = Field(default=1.12, ge=0.25, le=4.0)
     stability: Optional[float] = Field(None, ge=0.0, le=1.0)
     similarity_boost: Optional[float] = Field(None, ge=0.0, le=1.0)
     style: Optional[float] = Field(None, ge=0.0, le=1.0)
-    
-    @field_validator('text')
-    def validate_text(cls, v):
-        text = v.strip()
-        if not text:
-            raise ValueError("Text cannot be empty")
-
-        if len(text.encode('utf-8')) > 200000:  # ~200KB limit
-            raise ValueError("Text too long")
-        return text
@@ -1,16 +1,18 @@
 import time
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class RecommendationItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=1, max_length=200)
-    tags: List[str] = Field(default_factory=list, max_items=10)
+    tags: List[str] = Field(default_factory=list, max_length=10)
     popularity: Optional[float] = Field(None, ge=0.0, le=1.0)
 
     @field_validator('tags')
     def validate_tags(cls, v: List[str]) -> List[str]:
-        return [tag.strip() for tag in v if tag and tag.strip()]
+        return [tag for tag in map(str.strip, v) if tag]
 
 
 class InsightsResponse(BaseModel):
@@ -1,11 +1,14 @@
-from typing import List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 class Topic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(min_length=1)
     country: str = Field(min_length=2, max_length=2)
     timestamp: Optional[int] = Field(None, ge=0)
     formatted_timestamp: Optional[str] = None
     search_volume: Optional[int] = Field(None, ge=0)
     related_queries: List[str] = Field(default_factory=list)
-    category: Optional[Union[str, int]] = None
+    # Google Trends category id, coerced to int by the scraper
+    category: Optional[int] = None
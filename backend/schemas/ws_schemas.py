@@ -1,10 +1,12 @@
 from typing import Literal, Optional, Union
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 AudioBuffer = bytes
 
 class CountryData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     code: str
     name: str
 
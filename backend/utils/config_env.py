@@ -0,0 +1,11 @@
+import os
+from dataclasses import field
+from typing import Optional
+
+
+def env_field(name: str, default: Optional[str] = None, cast=str, in_repr: bool = True):
+    """Dataclass field read from the environment when the config is built"""
+    def read():
+        value = os.getenv(name, default)
+        return cast(value) if value is not None else None
+    return field(default_factory=read, repr=in_repr)
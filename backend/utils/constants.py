@@ -1,4 +1,6 @@
-cloning_sentences = [
+import sys
+
+cloning_sentences = tuple(sys.intern(s) for s in (
     'When the sunlight strikes raindrops in the air, they act like a prism and form a rainbow. The rainbow is a division of white light into many beautiful colors',
     'The north wind and the sun were disputing which was the stronger, when a traveler came along wrapped in a warm cloak',
     'You wish to know all about my grandfather? Well, he’s dead now, but he lived in the Bighorn Mountains all of his life',
@@ -8,4 +10,4 @@ cloning_sentences = [
     'Don’t miss out—join us this weekend for the grand opening! Live music, free giveaways, and specials you won’t believe',
     'I never thought switching services would be this easy. From sign‑up to support, everything was seamless—and I couldn’t be happier.',
     'Can you imagine life without music? Neither can I! Let’s explore the sounds that shape our world: from whispers to thunderous symphonies.'
-]
\ No newline at end of file
+))
\ No newline at end of file
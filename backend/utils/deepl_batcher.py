@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+from utils.deepl_utils import translate_many
+
+logger = logging.getLogger(__name__)
+
+# DeepL accepts at most 50 `text` entries per request
+MAX_TEXTS_PER_REQUEST = 50
+
+
+class DeepLBatcher:
+    """
+    Coalesces concurrent translate calls into shared DeepL requests.
+
+    Calls arriving within `window` seconds for the same (source, target) pair
+    are merged into one DeepL `text[]` request of up to `max_texts` unique entries,
+    and each caller gets back its own slice of the result.
+    """
+
+    def __init__(self, window: float = 0.02, max_texts: int = MAX_TEXTS_PER_REQUEST):
+        self.window = window
+        self.max_texts = max_texts
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def translate(
+        self,
+        text: Union[str, List[str]],
+        source: str,
+        target: str
+    ) -> Optional[Union[str, List[str]]]:
+        """Same contract as `deepl_utils.translate`, but batched with other callers."""
+        texts = [text] if isinstance(text, str) else list(text)
+        if not texts:
+            return []
+
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, source, target, future))
+        result = await future
+
+        if result is None or not isinstance(text, str):
+            return result
+        return result[0]
+
+    async def close(self):
+        """Stop the background worker"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._queue = None
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            pending_texts = len(batch[0][0])
+            deadline = loop.time() + self.window
+
+            while pending_texts < self.max_texts:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                pending_texts += len(item[0])
+
+            groups: Dict[Tuple[str, str], list] = {}
+            for item in batch:
+                groups.setdefault((item[1], item[2]), []).append(item)
+
+            await asyncio.gather(*(
+                self._flush(source, target, items)
+                for (source, target), items in groups.items()
+            ))
+
+    async def _flush(self, source: str, target: str, items: list):
+        # Identical sentences requested by different callers are only sent once
+        unique: Dict[str, int] = {}
+        for texts, _, _, _ in items:
+            for t in texts:
+                unique.setdefault(t, len(unique))
+
+        keys = list(unique)
+        chunks = [
+            keys[i:i + self.max_texts]
+            for i in range(0, len(keys), self.max_texts)
+        ]
+        results = await asyncio.gather(*(translate_many(chunk, source, target) for chunk in chunks))
+
+        translated: Optional[List[str]] = []
+        for chunk_result in results:
+            if chunk_result is None:
+                translated = None
+                break
+            translated.extend(chunk_result)
+
+        if translated is None:
+            logger.error(f"Batched translation {source} -> {target} failed for {len(items)} callers")
+
+        for texts, _, _, future in items:
+            if future.done():
+                continue
+            if translated is None:
+                future.set_result(None)
+            else:
+                future.set_result([translated[unique[t]] for t in texts])
+
+
+batcher = DeepLBatcher()
@@ -1,24 +1,110 @@
 import asyncio
+import functools
 import logging
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 import deepl
+from cachetools import TTLCache
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 translator = deepl.Translator(os.getenv("DEEPL_AUTH_KEY"))
 
-async def translate(text: str, source: str, target: str) -> Optional[str]:
+# DeepL's SDK is blocking, so calls run on a small dedicated pool rather than
+# competing with everything else for the default executor
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DEEPL_WORKERS", "8")),
+    thread_name_prefix="deepl"
+)
+
+# (source, target, text) -> translated text. Repeated product copy and CTAs
+# are served from memory instead of another DeepL round-trip
+_translation_cache: TTLCache = TTLCache(maxsize=10_000, ttl=86400)
+# Translations currently being fetched, so identical concurrent calls share one request
+_in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+async def translate(
+    text: Union[str, List[str]], 
+    source: str, 
+    target: str
+) -> Optional[Union[str, List[str]]]:
+    """
+    Translate a string, or a list of strings in a single DeepL request.
+    Returns the same shape that was passed in.
+    """
+    texts = [text] if isinstance(text, str) else list(text)
+    translated = await _translate_cached(texts, source, target)
+
+    if translated is None or not isinstance(text, str):
+        return translated
+    return translated[0]
+
+def clear_translation_cache():
+    """Drop every cached translation, e.g. after a glossary change."""
+    _translation_cache.clear()
+
+async def translate_many(texts: List[str], source: str, target: str) -> Optional[List[str]]:
+    """Translate a list of strings in one DeepL request, preserving order."""
+    if not texts:
+        return []
+    return await _translate_cached(list(texts), source, target)
+
+async def _translate_cached(texts: List[str], source: str, target: str) -> Optional[List[str]]:
+    """Serve what we can from the cache and fetch the rest in one DeepL call."""
+    loop = asyncio.get_running_loop()
+    found: Dict[str, str] = {}
+    waiting: Dict[str, asyncio.Future] = {}
+    owned: Dict[str, asyncio.Future] = {}
+
+    for t in dict.fromkeys(texts):
+        key = (source, target, t)
+        if key in _translation_cache:
+            found[t] = _translation_cache[key]
+        elif key in _in_flight:
+            waiting[t] = _in_flight[key]
+        else:
+            owned[t] = _in_flight[key] = loop.create_future()
+
+    if owned:
+        misses = list(owned)
+        fetched = None
+        try:
+            fetched = await _translate_remote(misses, source, target)
+        finally:
+            for i, t in enumerate(misses):
+                _in_flight.pop((source, target, t), None)
+                value = fetched[i] if fetched else None
+                if value is not None:
+                    _translation_cache[(source, target, t)] = value
+                # Waiters get None on failure (or if we were cancelled) rather than hanging
+                owned[t].set_result(value)
+                found[t] = value
+
+    for t, future in waiting.items():
+        found[t] = await asyncio.shield(future)
+
+    if any(found[t] is None for t in found):
+        return None
+    return [found[t] for t in texts]
+
+async def _translate_remote(texts: List[str], source: str, target: str) -> Optional[List[str]]:
     try:
-        result = await asyncio.to_thread(
-            translator.translate_text,
-            text,
-            source_lang=source,
-            target_lang=target,
-            preserve_formatting=True
+        result = await asyncio.get_running_loop().run_in_executor(
+            _executor,
+            functools.partial(
+                translator.translate_text,
+                texts,
+                source_lang=source,
+                target_lang=target,
+                preserve_formatting=True
+            )
         )
-        return result.text
+        return [r.text for r in result]
     except Exception as e:
         logger.error(f"Error in [translate]: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def shutdown_executor():
+    """Stop the DeepL worker threads"""
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -1,24 +1,28 @@
-import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 
+from utils.config_env import env_field
 from utils.gpt_utils.dataclasses import GPTModel
 from utils.gpt_utils.exceptions import ConfigurationError
 
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class GPTConfig:
     """Configuration for GPT client"""
     
-    def __init__(self):
-        self.api_key = os.getenv('OPENAI_API_KEY')
-        self.organization = os.getenv('OPENAI_ORGANIZATION')
-        self.model = os.getenv('GPT_MODEL', GPTModel.GPT_4_1.value)
-        self.timeout = float(os.getenv('GPT_TIMEOUT', '60.0'))
-        self.max_retries = int(os.getenv('GPT_MAX_RETRIES', '3'))
-        self.max_tokens = int(os.getenv('GPT_MAX_TOKENS', '4000'))
-        self.temperature = float(os.getenv('GPT_TEMPERATURE', '0.7'))
-        self.request_timeout = float(os.getenv('GPT_REQUEST_TIMEOUT', '120.0'))
-        
+    api_key: Optional[str] = env_field('OPENAI_API_KEY', in_repr=False)
+    organization: Optional[str] = env_field('OPENAI_ORGANIZATION')
+    model: str = env_field('GPT_MODEL', GPTModel.GPT_4_1.value)
+    timeout: float = env_field('GPT_TIMEOUT', '60.0', float)
+    max_retries: int = env_field('GPT_MAX_RETRIES', '3', int)
+    max_tokens: int = env_field('GPT_MAX_TOKENS', '4000', int)
+    temperature: float = env_field('GPT_TEMPERATURE', '0.7', float)
+    request_timeout: float = env_field('GPT_REQUEST_TIMEOUT', '120.0', float)
+    
+    def __post_init__(self):
         self._validate_config()
     
     def _validate_config(self):
@@ -30,4 +34,10 @@ class GPTConfig:
             raise ConfigurationError("Temperature must be between 0.0 and 2.0")
         
         if self.max_tokens < 1 or self.max_tokens > 8192:
-            raise ConfigurationError("Max tokens must be between 1 and 8192")
\ No newline at end of file
+            raise ConfigurationError("Max tokens must be between 1 and 8192")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> GPTConfig:
+    """Read and validate the environment once; every GPT client shares the result"""
+    return GPTConfig()
\ No newline at end of file
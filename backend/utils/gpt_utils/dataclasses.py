@@ -9,27 +9,33 @@ class GPTModel(str, Enum):
     GPT_4_1 = "gpt-4.1"
     GPT_3_5_TURBO = "gpt-3.5-turbo"
 
-@dataclass
+@dataclass(slots=True)
 class GPTMetrics:
     """Track GPT API usage metrics"""
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
     total_tokens_used: int = 0
+    cached_tokens: int = 0
     total_response_time: float = 0.0
     start_time: float = field(default_factory=time.time)
     transcript_requests: int = 0
     slang_requests: int = 0
     rate_limit_hits: int = 0
+    # Derived ratios, kept current by record_success/record_failure so reads are plain attributes
+    success_rate: float = 0.0
+    average_response_time: float = 0.0
+    average_tokens_per_request: float = 0.0
 
-    @property
-    def success_rate(self) -> float:
-        return (self.successful_requests / self.total_requests) if self.total_requests > 0 else 0.0
+    def record_success(self, response_time: float, tokens: int, cached_tokens: int = 0):
+        self.successful_requests += 1
+        self.total_response_time += response_time
+        self.total_tokens_used += tokens
+        self.cached_tokens += cached_tokens
+        self.success_rate = self.successful_requests / self.total_requests
+        self.average_response_time = self.total_response_time / self.successful_requests
+        self.average_tokens_per_request = self.total_tokens_used / self.successful_requests
 
-    @property
-    def average_response_time(self) -> float:
-        return (self.total_response_time / self.successful_requests) if self.successful_requests > 0 else 0.0
-
-    @property
-    def average_tokens_per_request(self) -> float:
-        return (self.total_tokens_used / self.successful_requests) if self.successful_requests > 0 else 0.0
+    def record_failure(self):
+        self.failed_requests += 1
+        self.success_rate = self.successful_requests / self.total_requests
\ No newline at end of file
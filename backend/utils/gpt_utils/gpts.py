@@ -1,101 +1,182 @@
+import functools
 import json
 import time
 import asyncio
-from typing import Optional, Union, Dict, Any
+import os
+from types import MappingProxyType
+from typing import Optional, Union, Dict, Any, Mapping
 from contextlib import asynccontextmanager
 import sys
 
-from openai import AsyncOpenAI, RateLimitError
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, NotFoundError, RateLimitError
+from pydantic import BaseModel, TypeAdapter
 import structlog
 import tenacity
 
 from prompts import transcript_prompts, slang_prompts
 from schemas.gpt_schemas import ResponseSchema, SlangRequest, SlangsResponse, TranscriptRequest
-from utils.gpt_utils.config import GPTConfig
+from utils.gpt_utils.config import GPTConfig, get_config
 from utils.gpt_utils.dataclasses import GPTMetrics
 from utils.gpt_utils.exceptions import (
     APIQuotaError, 
     ContentFilterError, 
     GPTError, 
     ModelNotFoundError, 
+    RateLimitError as GPTRateLimitError,
     TokenLimitError, 
     ConfigurationError)
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
+# Built once at import so dict requests don't go through model __init__ each call
+_TRANSCRIPT_ADAPTER = TypeAdapter(TranscriptRequest)
+_SLANG_ADAPTER = TypeAdapter(SlangRequest)
+
+
+def _strict_json_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    """
+    JSON schema for `model` in the form OpenAI's strict structured outputs
+    require: every object closed to extra keys and listing all its properties
+    as required. Built from pydantic's own schema rather than the SDK's
+    private helper.
+    """
+    def tighten(node):
+        if isinstance(node, dict):
+            if node.get("type") == "object" and "properties" in node:
+                node["additionalProperties"] = False
+                node["required"] = list(node["properties"])
+            for value in node.values():
+                tighten(value)
+        elif isinstance(node, list):
+            for value in node:
+                tighten(value)
+        return node
+
+    return tighten(model.model_json_schema())
+
+# Sent with every batch transcript request, so built once
+_RESPONSE_JSON_SCHEMA = _strict_json_schema(ResponseSchema)
+
+# Shared read-only usage for responses without a usage block
+_ZERO_USAGE = MappingProxyType({'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0, 'cached_tokens': 0})
+
+# OpenAI error codes that map to a more specific exception than GPTError
+_OPENAI_ERROR_CODES = {
+    "insufficient_quota": APIQuotaError,
+    "context_length_exceeded": TokenLimitError,
+    "string_above_max_length": TokenLimitError,
+    "content_filter": ContentFilterError,
+    "content_policy_violation": ContentFilterError,
+    "model_not_found": ModelNotFoundError,
+}
+
+# Caps concurrent OpenAI calls from generate_transcripts_many to stay under RPM limits
+_OPENAI_SEMAPHORE = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "20")))
+
+# Slang lookups (web search + model call) are the most expensive requests here and
+# change slowly, so results are kept per (country, model) for a day
+_SLANG_TTL = 24 * 3600
+_slang_cache: Dict[tuple, tuple] = {}
+_slang_in_flight: Dict[tuple, asyncio.Future] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _slang_user_payload(country: str) -> str:
+    """Serialized slang request input, built once per country"""
+    return orjson.dumps(slang_prompts.user_prompt(country)).decode()
+
+
+# Batch jobs that end in any of these states won't produce (more) output
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# One OpenAI client (and connection pool) per config, shared by every GPT instance
+# so requests reuse warm TLS connections instead of opening a new pool each time
+_openai_clients: Dict[GPTConfig, AsyncOpenAI] = {}
+
+
+def _get_openai_client(config: GPTConfig) -> AsyncOpenAI:
+    client = _openai_clients.get(config)
+    if client is None or client.is_closed():
+        client_kwargs = {
+            'api_key': config.api_key,
+            'timeout': config.timeout,
+            'max_retries': config.max_retries,
+            'http_client': DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        }
+        
+        if config.organization:
+            client_kwargs['organization'] = config.organization
+        
+        client = _openai_clients[config] = AsyncOpenAI(**client_kwargs)
+    return client
+
+
+async def close_openai_clients():
+    """Close the shared OpenAI connection pools"""
+    clients = list(_openai_clients.values())
+    _openai_clients.clear()
+    for client in clients:
+        await client.close()
+
+
 class GPT:
     """Production-ready GPT client with comprehensive error handling"""
     
     def __init__(self, config: Optional[GPTConfig] = None):
-        self.config = config or GPTConfig()
+        self.config = config or get_config()
         self.metrics = GPTMetrics()
-        
-        client_kwargs = {
-            'api_key': self.config.api_key,
-            'timeout': self.config.timeout,
-            'max_retries': self.config.max_retries
-        }
-        
-        if self.config.organization:
-            client_kwargs['organization'] = self.config.organization
-        
-        self.client = AsyncOpenAI(**client_kwargs)
+        self.client = _get_openai_client(self.config)
         
         logger.info("GPT client initialized", 
                    model=self.config.model,
                    timeout=self.config.timeout,
                    max_retries=self.config.max_retries)
 
-    def _extract_usage_info(self, response: Any) -> Dict[str, int]:
+    def _extract_usage_info(self, response: Any) -> Mapping[str, int]:
         """Extract token usage information from response"""
-        try:
-            if hasattr(response, 'usage') and response.usage:
-                return {
-                    'prompt_tokens': response.usage.prompt_tokens or 0,
-                    'completion_tokens': response.usage.completion_tokens or 0,
-                    'total_tokens': response.usage.total_tokens or 0
-                }
-        except Exception as e:
-            logger.warning("Could not extract usage info", error=str(e))
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return _ZERO_USAGE
         
-        return {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+        # The Responses API reports input/output tokens, and the prompt-cache
+        # hits (from the shared system prompt prefix) under input_tokens_details
+        details = getattr(usage, 'input_tokens_details', None)
+        return {
+            'prompt_tokens': getattr(usage, 'input_tokens', 0) or 0,
+            'completion_tokens': getattr(usage, 'output_tokens', 0) or 0,
+            'total_tokens': getattr(usage, 'total_tokens', 0) or 0,
+            'cached_tokens': getattr(details, 'cached_tokens', 0) or 0
+        }
 
     def _handle_openai_error(self, error: Exception, operation: str) -> None:
         """Handle OpenAI-specific errors"""
-        error_message = str(error).lower()
-        
-        if 'rate limit' in error_message:
-            self.metrics.rate_limit_hits += 1
-            raise RateLimitError(f"OpenAI rate limit exceeded during {operation}")
-        elif 'quota' in error_message or 'insufficient_quota' in error_message:
+        # The SDK raises typed errors carrying the API's error code, so classify
+        # on those instead of matching substrings of the message
+        error_type = _OPENAI_ERROR_CODES.get(getattr(error, 'code', None))
+
+        if error_type is APIQuotaError:
             raise APIQuotaError(f"OpenAI API quota exceeded during {operation}")
-        elif 'model' in error_message and 'not found' in error_message:
-            raise ModelNotFoundError(f"Model {self.config.model} not found during {operation}")
-        elif 'maximum context length' in error_message or 'token' in error_message:
+        elif error_type is TokenLimitError:
             raise TokenLimitError(f"Token limit exceeded during {operation}")
-        elif 'content_filter' in error_message or 'content policy' in error_message:
+        elif error_type is ContentFilterError:
             raise ContentFilterError(f"Content filtered by OpenAI during {operation}")
+        elif isinstance(error, RateLimitError) or getattr(error, 'status_code', None) == 429:
+            self.metrics.rate_limit_hits += 1
+            raise GPTRateLimitError(f"OpenAI rate limit exceeded during {operation}")
+        elif error_type is ModelNotFoundError or isinstance(error, NotFoundError):
+            raise ModelNotFoundError(f"Model {self.config.model} not found during {operation}")
         else:
             raise GPTError(f"OpenAI API error during {operation}: {error}")
 
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(3),
         wait=tenacity.wait_exponential(multiplier=1, min=2, max=10),
-        retry=tenacity.retry_if_exception_type((RateLimitError, GPTError)),
+        retry=tenacity.retry_if_exception_type((GPTRateLimitError, GPTError)),
         reraise=True
     )
     async def _make_openai_request(
@@ -107,36 +188,31 @@ class GPT:
         """Make OpenAI request with retry logic and error handling"""
         start_time = time.time()
         self.metrics.total_requests += 1
+        log = logger.bind(operation=operation, model=self.config.model, request_id=request_id)
         
         try:
-            logger.info("Making OpenAI request", 
-                       operation=operation,
-                       model=self.config.model,
-                       request_id=request_id)
+            log.info("Making OpenAI request")
             
             response = await request_func()
             
             response_time = time.time() - start_time
-            self.metrics.total_response_time += response_time
-            self.metrics.successful_requests += 1
-            
             usage_info = self._extract_usage_info(response)
-            self.metrics.total_tokens_used += usage_info.get('total_tokens', 0)
+            self.metrics.record_success(
+                response_time,
+                usage_info.get('total_tokens', 0),
+                usage_info.get('cached_tokens', 0)
+            )
             
-            logger.info("OpenAI request successful",
-                       operation=operation,
-                       response_time=response_time,
-                       tokens_used=usage_info.get('total_tokens', 0),
-                       request_id=request_id)
+            log.info("OpenAI request successful",
+                     response_time=response_time,
+                     tokens_used=usage_info.get('total_tokens', 0),
+                     cached_tokens=usage_info.get('cached_tokens', 0))
             
             return response
             
         except Exception as e:
-            self.metrics.failed_requests += 1
-            logger.error("OpenAI request failed",
-                        operation=operation,
-                        error=str(e),
-                        request_id=request_id)
+            self.metrics.record_failure()
+            log.error("OpenAI request failed", error=str(e))
             
             self._handle_openai_error(e, operation)
 
@@ -149,7 +225,7 @@ class GPT:
 
         if isinstance(request, dict):
             try:
-                request = TranscriptRequest(**request)
+                request = _TRANSCRIPT_ADAPTER.validate_python(request)
             except Exception as e:
                 logger.error("Invalid transcript request", error=str(e), request_id=request_id)
                 raise ValueError(f"Invalid request parameters: {e}")
@@ -186,7 +262,7 @@ class GPT:
                 logger.warning("Empty response from OpenAI", request_id=request_id)
                 return None
                 
-        except (RateLimitError, APIQuotaError, ModelNotFoundError, 
+        except (GPTRateLimitError, APIQuotaError, ModelNotFoundError, 
                 TokenLimitError, ContentFilterError):
             # Re-raise specific errors
             raise
@@ -196,6 +272,138 @@ class GPT:
                         request_id=request_id)
             raise GPTError(f"Failed to generate transcripts: {e}")
 
+    async def generate_transcripts_many(
+        self,
+        requests: list[Union[TranscriptRequest, dict]]
+    ) -> list[Union[Optional[ResponseSchema], BaseException]]:
+        """
+        Run several transcript requests concurrently, bounded by OPENAI_CONCURRENCY.
+        Results keep the request order; a failed request yields its exception
+        instead of cancelling the others (each call still retries on its own).
+        """
+        async def bounded(request):
+            async with _OPENAI_SEMAPHORE:
+                return await self.generate_transcripts(request)
+
+        return await asyncio.gather(
+            *(bounded(request) for request in requests),
+            return_exceptions=True
+        )
+
+    async def generate_transcripts_batch(
+        self,
+        requests: list[Union[TranscriptRequest, dict]],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        max_wait: float = 24 * 3600
+    ) -> list[Optional[ResponseSchema]]:
+        """
+        Generate transcripts for many requests through the OpenAI Batch API.
+
+        Meant for offline work (pre-generation, backfills) that can wait minutes
+        for results: it costs less and doesn't count against per-minute limits.
+        Interactive flows should keep using generate_transcripts.
+        Results are returned in request order, None where a request failed.
+        """
+        requests = [
+            _TRANSCRIPT_ADAPTER.validate_python(r) if isinstance(r, dict) else r
+            for r in requests
+        ]
+        if not requests:
+            return []
+
+        text_format = {
+            "format": {
+                "type": "json_schema",
+                "name": ResponseSchema.__name__,
+                "schema": _RESPONSE_JSON_SCHEMA,
+                "strict": True
+            }
+        }
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {
+                    "model": self.config.model,
+                    "instructions": transcript_prompts.system_prompt(
+                        request.variations,
+                        request.with_forecast,
+                        request.forecast_days
+                    ),
+                    "input": request.user_prompt,
+                    "text": text_format
+                }
+            })
+            for i, request in enumerate(requests)
+        ]
+        self.metrics.transcript_requests += len(requests)
+
+        try:
+            batch_file = await self.client.files.create(
+                file=("transcripts.jsonl", "\n".join(lines).encode()),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/responses",
+                completion_window="24h"
+            )
+            logger.info("Transcript batch submitted", batch_id=batch.id, requests=len(requests))
+
+            # Poll with exponential backoff until the batch finishes
+            deadline = time.monotonic() + max_wait
+            delay = poll_interval
+            while batch.status not in _BATCH_TERMINAL_STATUSES:
+                if time.monotonic() > deadline:
+                    raise GPTError(f"Transcript batch {batch.id} did not finish within {max_wait}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise GPTError(f"Transcript batch {batch.id} ended with status {batch.status}")
+
+            output = await self.client.files.content(batch.output_file_id)
+        except GPTError:
+            raise
+        except Exception as e:
+            logger.error("Transcript batch failed", error=str(e))
+            raise GPTError(f"Failed to run transcript batch: {e}")
+
+        results: list[Optional[ResponseSchema]] = [None] * len(requests)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                logger.warning("Transcript batch item failed",
+                               custom_id=item.get("custom_id"),
+                               error=item.get("error"))
+                continue
+
+            output_text = "".join(
+                content.get("text", "")
+                for entry in response["body"].get("output", [])
+                if entry.get("type") == "message"
+                for content in entry.get("content", [])
+                if content.get("type") == "output_text"
+            )
+            try:
+                results[int(item["custom_id"])] = ResponseSchema.model_validate_json(output_text)
+            except Exception as e:
+                logger.warning("Could not parse transcript batch item",
+                               custom_id=item.get("custom_id"),
+                               error=str(e))
+
+        logger.info("Transcript batch completed",
+                    batch_id=batch.id,
+                    succeeded=sum(r is not None for r in results),
+                    requests=len(requests))
+        return results
+
     async def get_slangs(
         self,
         request: Union[SlangRequest, dict, str],
@@ -204,14 +412,52 @@ class GPT:
         """Get slangs with comprehensive validation and error handling"""
         
         if isinstance(request, str):
-            request = SlangRequest(country=request)
+            request = _SLANG_ADAPTER.validate_python({"country": request})
         elif isinstance(request, dict):
             try:
-                request = SlangRequest(**request)
+                request = _SLANG_ADAPTER.validate_python(request)
             except Exception as e:
                 logger.error("Invalid slang request", error=str(e), request_id=request_id)
                 raise ValueError(f"Invalid request parameters: {e}")
-        
+
+        key = (request.country, self.config.model)
+        cached = _slang_cache.get(key)
+        if cached and time.monotonic() - cached[1] < _SLANG_TTL:
+            return cached[0]
+
+        # Concurrent lookups for the same country share one request
+        in_flight = _slang_in_flight.get(key)
+        if in_flight:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        _slang_in_flight[key] = future
+        try:
+            slangs = await self._fetch_slangs(request, request_id)
+        except BaseException as e:
+            # Waiters see the owner's error instead of hanging. A cancelled owner
+            # must not cancel them, so they get a plain GPTError for that
+            if isinstance(e, asyncio.CancelledError):
+                future.set_exception(GPTError("Slang lookup was cancelled"))
+            else:
+                future.set_exception(e)
+            # Mark it retrieved so asyncio doesn't warn when nobody was waiting
+            future.exception()
+            raise
+        else:
+            if slangs:
+                _slang_cache[key] = (slangs, time.monotonic())
+            future.set_result(slangs)
+            return slangs
+        finally:
+            del _slang_in_flight[key]
+
+    async def _fetch_slangs(
+        self,
+        request: SlangRequest,
+        request_id: str = None
+    ) -> Optional[SlangsResponse]:
+        """Ask the model for a country's slangs (uncached)"""
         self.metrics.slang_requests += 1
         
         try:
@@ -224,7 +470,7 @@ class GPT:
                         }
                     ],
                     instructions=slang_prompts.system_prompt(),
-                    input=json.dumps(slang_prompts.user_prompt(request.country)),
+                    input=_slang_user_payload(request.country),
                     text_format=SlangsResponse,
                     timeout=self.config.request_timeout
                 )
@@ -244,7 +490,7 @@ class GPT:
                 logger.warning("Empty response from OpenAI", request_id=request_id)
                 return None
                 
-        except (RateLimitError, APIQuotaError, ModelNotFoundError, 
+        except (GPTRateLimitError, APIQuotaError, ModelNotFoundError, 
                 TokenLimitError, ContentFilterError):
             # Re-raise specific errors
             raise
@@ -265,6 +511,7 @@ class GPT:
             "average_response_time": self.metrics.average_response_time,
             "total_tokens_used": self.metrics.total_tokens_used,
             "average_tokens_per_request": self.metrics.average_tokens_per_request,
+            "cached_tokens": self.metrics.cached_tokens,
             "transcript_requests": self.metrics.transcript_requests,
             "slang_requests": self.metrics.slang_requests,
             "rate_limit_hits": self.metrics.rate_limit_hits,
@@ -298,13 +545,8 @@ class GPT:
             }
 
     async def close(self):
-        """Clean up resources"""
-        try:
-            if hasattr(self.client, 'close'):
-                await self.client.close()
-            logger.info("GPT client closed successfully")
-        except Exception as e:
-            logger.error("Error closing GPT client", error=str(e))
+        """Clean up resources (the shared OpenAI client is closed by close_openai_clients)"""
+        logger.debug("GPT client released")
 
 
 @asynccontextmanager
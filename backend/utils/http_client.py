@@ -0,0 +1,25 @@
+from typing import Optional
+import httpx
+
+# Shared by the taste, news and weather clients so the context lookups for an ad
+# reuse pooled connections instead of each opening their own
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+    return _client
+
+
+async def close_shared_client():
+    """Close the process-wide HTTP client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
\ No newline at end of file
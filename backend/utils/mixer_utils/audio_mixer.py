@@ -1,33 +1,134 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import io
+import multiprocessing
+import os
 import time
 from contextlib import asynccontextmanager
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 
+import av
 from pydub import AudioSegment
-from pydub.exceptions import CouldntDecodeError
 from pydub.utils import which
 import structlog
 
 from utils.mixer_utils.exceptions import AudioFormatError, AudioProcessingError, ConfigurationError
 from utils.mixer_utils.dataclasses import AudioFormat, AudioInfo, MixerConfig, MixerMetrics
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
+# libav names for our formats where they differ from AudioFormat values
+_AV_DEMUXERS = {"m4a": "mov"}
+_AV_MUXERS = {"m4a": "ipod", "aac": "adts"}
+_AV_ENCODERS = {
+    "mp3": "libmp3lame",
+    "wav": "pcm_s16le",
+    "m4a": "aac",
+    "flac": "flac",
+    "ogg": "libvorbis",
+    "aac": "aac"
+}
+# Decoder names whose packets can be copied into each output format as-is
+_AV_REMUXABLE = {
+    "mp3": {"mp3", "mp3float"},
+    "wav": {"pcm_s16le"},
+    "m4a": {"aac"},
+    "flac": {"flac"},
+    "ogg": {"vorbis"},
+    "aac": {"aac"}
+}
+
+# Decoding and encoding are CPU-bound, so they run in worker processes with
+# their own GILs instead of threads contending for this one. forkserver
+# avoids forking a process that already runs the event loop's threads.
+# Created on first use, so importing the mixer doesn't set up the pool.
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=int(os.getenv("MIXER_WORKERS", os.cpu_count() or 1)),
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _pool
+
+
+def shutdown_worker_pool():
+    """Stop the audio worker processes"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# Lowercase values, which most callers pass, resolve with one dict lookup
+_CANONICAL_FORMATS = {audio_format.value: audio_format for audio_format in AudioFormat}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_format(format_str: str) -> Optional[AudioFormat]:
+    """Map a user-supplied format string to an AudioFormat, or None if unknown"""
+    try:
+        return AudioFormat(format_str.lower().strip())
+    except ValueError:
+        return None
+
+
+@functools.cache
+def _health_check_audio(format_str: str) -> bytes:
+    """One second of silence, encoded on the first health check only"""
+    buffer = io.BytesIO()
+    AudioSegment.silent(duration=1000).export(buffer, format=format_str)
+    return buffer.getvalue()
+
+
+def _open_container(buffer: io.BytesIO, audio_format: str):
+    """Open a buffer with libav, returning the container and its first audio stream"""
+    buffer.seek(0)
+    container = av.open(buffer, mode="r", format=_AV_DEMUXERS.get(audio_format, audio_format))
+    if not container.streams.audio:
+        container.close()
+        raise AudioFormatError("No audio stream found")
+    return container, container.streams.audio[0]
+
+
+def _transcode(data: bytes, input_format: str, output_format: str) -> bytes:
+    """Convert between container formats. Runs in the worker pool."""
+    buffer = io.BytesIO()
+    try:
+        container, in_stream = _open_container(io.BytesIO(data), input_format)
+        with container, av.open(
+            buffer, mode="w", format=_AV_MUXERS.get(output_format, output_format)
+        ) as output:
+            if in_stream.codec_context.name in _AV_REMUXABLE[output_format]:
+                # Same codec, different container: copy packets without decoding
+                out_stream = output.add_stream_from_template(in_stream)
+                for packet in container.demux(in_stream):
+                    if packet.dts is None:
+                        continue
+                    packet.stream = out_stream
+                    output.mux(packet)
+            else:
+                out_stream = output.add_stream(
+                    _AV_ENCODERS[output_format],
+                    rate=in_stream.rate,
+                    layout="stereo" if in_stream.codec_context.channels > 1 else "mono"
+                )
+                # Parallelism comes from the pool's processes; codec threads
+                # on top would oversubscribe the cores
+                in_stream.codec_context.thread_count = 1
+                out_stream.codec_context.thread_count = 1
+                for frame in container.decode(in_stream):
+                    frame.pts = None
+                    output.mux(out_stream.encode(frame))
+                output.mux(out_stream.encode(None))
+    except av.error.FFmpegError as e:
+        raise AudioProcessingError(str(e))
+    return buffer.getvalue()
+
 class AudioMixer:
     """Production-ready audio mixer with comprehensive error handling"""
     
@@ -56,10 +157,8 @@ class AudioMixer:
         if not isinstance(buffer, io.BytesIO):
             raise AudioFormatError(f"{name} must be a BytesIO object")
         
-        current_pos = buffer.tell()
-        buffer.seek(0, 2)  # Seek to end
-        size = buffer.tell()
-        buffer.seek(current_pos)  # Restore position
+        # O(1) and leaves the cursor where it is
+        size = buffer.getbuffer().nbytes
         
         if size == 0:
             raise AudioFormatError(f"{name} buffer is empty")
@@ -76,62 +175,60 @@ class AudioMixer:
         if not format_str:
             raise AudioFormatError("Audio format cannot be empty")
         
-        try:
-            audio_format = AudioFormat(format_str.lower().strip())
-        except ValueError:
+        audio_format = _CANONICAL_FORMATS.get(format_str) or _parse_format(format_str)
+        if audio_format is None:
             raise AudioFormatError(
                 f"Unsupported audio format: {format_str}. "
                 f"Supported formats: {[f.value for f in self.config.supported_formats]}"
             )
         
-        if audio_format not in self.config.supported_formats:
+        if audio_format not in self.config.enabled_formats:
             raise AudioFormatError(f"Audio format {audio_format.value} is not enabled")
         
         return audio_format
     
-    def _load_audio_segment(self, buffer: io.BytesIO, format_str: str, name: str) -> AudioSegment:
-        """Safely load audio segment from buffer"""
-        try:
-            buffer.seek(0)
-            audio_format = self._validate_audio_format(format_str)
-            
-            # Try to load the audio
-            audio = AudioSegment.from_file(buffer, format=audio_format.value)
-            
-            # Validate duration
-            max_duration_ms = self.config.max_duration_minutes * 60 * 1000
-            if len(audio) > max_duration_ms:
-                raise AudioProcessingError(
-                    f"{name} exceeds maximum duration of {self.config.max_duration_minutes} minutes "
-                    f"(actual: {len(audio) / 1000 / 60:.1f} minutes)"
-                )
-            
-            if audio.channels > 2:
-                logger.warning(f"{name} has {audio.channels} channels, converting to stereo")
-                audio = audio.set_channels(2)
-            
-            logger.debug("Audio loaded successfully",
-                        name=name,
-                        duration_ms=len(audio),
-                        channels=audio.channels,
-                        sample_rate=audio.frame_rate)
-            
-            return audio
-            
-        except CouldntDecodeError as e:
-            raise AudioFormatError(f"Could not decode {name}: {e}")
-        except Exception as e:
-            raise AudioProcessingError(f"Failed to load {name}: {e}")
+    def _check_duration(self, duration_ms: int, name: str) -> None:
+        max_duration_ms = self.config.max_duration_minutes * 60 * 1000
+        if duration_ms > max_duration_ms:
+            raise AudioProcessingError(
+                f"{name} exceeds maximum duration of {self.config.max_duration_minutes} minutes "
+                f"(actual: {duration_ms / 1000 / 60:.1f} minutes)"
+            )
     
-    def _get_audio_info(self, audio: AudioSegment, format_str: str) -> AudioInfo:
-        """Get comprehensive audio information"""
+    def _get_audio_info(self, buffer: io.BytesIO, format_str: str) -> AudioInfo:
+        """Read audio information from the stream headers, without decoding"""
+        try:
+            audio_format = self._validate_audio_format(format_str).value
+            container, stream = _open_container(buffer, audio_format)
+            with container:
+                if stream.duration is not None:
+                    duration_ms = int(stream.duration * stream.time_base * 1000)
+                elif container.duration is not None:
+                    duration_ms = container.duration * 1000 // av.time_base
+                else:
+                    # Headerless streams (e.g. raw ADTS): add up packet durations,
+                    # which only demuxes and still decodes nothing
+                    ticks = sum(packet.duration or 0 for packet in container.demux(stream))
+                    if not ticks:
+                        raise AudioFormatError("Audio duration is unknown")
+                    duration_ms = int(ticks * stream.time_base * 1000)
+                channels = stream.codec_context.channels
+                sample_rate = stream.rate
+        except (AudioFormatError, AudioProcessingError):
+            raise
+        except av.error.InvalidDataError as e:
+            raise AudioFormatError(f"Could not decode audio: {e}")
+        
+        self._check_duration(duration_ms, "audio")
+        
         return AudioInfo(
-            duration_ms=len(audio),
-            duration_seconds=len(audio) / 1000.0,
-            channels=audio.channels,
-            sample_rate=audio.frame_rate,
-            frame_rate=audio.frame_rate,
-            format=format_str
+            duration_ms=duration_ms,
+            duration_seconds=duration_ms / 1000.0,
+            channels=channels,
+            sample_rate=sample_rate,
+            frame_rate=sample_rate,
+            format=format_str,
+            file_size_bytes=buffer.getbuffer().nbytes
         )
     
     async def get_audio_info(
@@ -148,13 +245,9 @@ class AudioMixer:
         try:
             self._validate_buffer(audio_buffer, "audio")
             
-            def _get_info_sync() -> AudioInfo:
-                audio = self._load_audio_segment(audio_buffer, format_str, "audio")
-                return self._get_audio_info(audio, format_str)
-            
             logger.info("Getting audio info", format=format_str, operation_id=operation_id)
             
-            info = await asyncio.to_thread(_get_info_sync)
+            info = await asyncio.to_thread(self._get_audio_info, audio_buffer, format_str)
             
             processing_time = time.time() - start_time
             self.metrics.total_processing_time += processing_time
@@ -193,6 +286,106 @@ class AudioMixer:
             logger.error("Error getting audio duration", error=str(e), operation_id=operation_id)
             return None
     
+    @staticmethod
+    async def _feed_pipe(fd: int, data: memoryview):
+        """
+        Write `data` into a pipe from the event loop, straight from the caller's
+        buffer: no blocking thread and no intermediate copy of the audio.
+        """
+        loop = asyncio.get_running_loop()
+        os.set_blocking(fd, False)
+        try:
+            while data:
+                try:
+                    written = os.write(fd, data)
+                except BlockingIOError:
+                    writable = loop.create_future()
+                    loop.add_writer(fd, lambda: writable.done() or writable.set_result(None))
+                    try:
+                        await writable
+                    finally:
+                        loop.remove_writer(fd)
+                    continue
+                except BrokenPipeError:
+                    # FFmpeg stopped reading (e.g. it failed); its exit status reports why
+                    return
+                data = data[written:]
+        finally:
+            os.close(fd)
+    
+    async def _ffmpeg_merge(
+        self,
+        speech_data: memoryview,
+        music_data: memoryview,
+        speech_format: str,
+        music_format: str,
+        output_format: str,
+        duration_ms: int,
+        music_reduction_db: float,
+        fade_duration_ms: int
+    ) -> bytes:
+        """
+        Loop/trim the music to `duration_ms`, duck it, fade it out and lay the
+        speech over it in one FFmpeg pass. Both inputs are streamed in through
+        their own pipes and the encoded mix is read back from stdout. Formats are
+        validated AudioFormat values, mapped to FFmpeg's (de)muxer names here.
+        """
+        duration = duration_ms / 1000
+        fade = fade_duration_ms / 1000
+        filter_graph = (
+            f"[1:a]aformat=channel_layouts=stereo,aloop=loop=-1:size=2147483647,"
+            f"atrim=end={duration},asetpts=N/SR/TB,volume=-{music_reduction_db}dB"
+            + (f",afade=t=out:st={duration - fade}:d={fade}" if fade > 0 else "")
+            + "[music];"
+            "[0:a]aformat=channel_layouts=stereo[speech];"
+            # normalize=0 adds the tracks as-is, like an overlay
+            "[music][speech]amix=inputs=2:duration=first:normalize=0[out]"
+        )
+        
+        # MP4 can't seek back to write its index on a pipe, so write it fragmented
+        output_options = ("-movflags", "frag_keyframe+empty_moov") if output_format == "m4a" else ()
+        
+        speech_read, speech_write = os.pipe()
+        music_read, music_write = os.pipe()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", _AV_DEMUXERS.get(speech_format, speech_format), "-i", f"pipe:{speech_read}",
+                "-f", _AV_DEMUXERS.get(music_format, music_format), "-i", f"pipe:{music_read}",
+                "-filter_complex", filter_graph,
+                "-map", "[out]",
+                *output_options,
+                "-f", _AV_MUXERS.get(output_format, output_format), "pipe:1",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                pass_fds=(speech_read, music_read)
+            )
+        except BaseException:
+            for fd in (speech_write, music_write):
+                os.close(fd)
+            raise
+        finally:
+            # The child holds its own copies of the read ends
+            os.close(speech_read)
+            os.close(music_read)
+        
+        try:
+            (stdout, stderr), _, _ = await asyncio.gather(
+                proc.communicate(),
+                self._feed_pipe(speech_write, speech_data),
+                self._feed_pipe(music_write, music_data)
+            )
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+            raise
+        
+        if proc.returncode != 0:
+            raise AudioProcessingError(f"FFmpeg merge failed: {stderr.decode().strip()[-500:]}")
+        
+        return stdout
+    
     async def merge_music_with_speech(
         self,
         speech_buffer: io.BytesIO,
@@ -205,7 +398,10 @@ class AudioMixer:
         music_extension_ms: Optional[int] = None,
         operation_id: str = None
     ) -> Optional[io.BytesIO]:
-        """Merge music with speech with comprehensive configuration options"""
+        """
+        Merge music with speech with comprehensive configuration options.
+        The mix runs as a single FFmpeg filter graph.
+        """
         start_time = time.time()
         self.metrics.total_operations += 1
         self.metrics.merge_operations += 1
@@ -217,7 +413,9 @@ class AudioMixer:
         try:
             self._validate_buffer(speech_buffer, "speech")
             self._validate_buffer(music_buffer, "music")
-            self._validate_audio_format(output_format)
+            speech_format = self._validate_audio_format(speech_format).value
+            music_format = self._validate_audio_format(music_format).value
+            output_format = self._validate_audio_format(output_format).value
             
             if music_reduction_db < 0:
                 raise ValueError("music_reduction_db cannot be negative")
@@ -226,61 +424,35 @@ class AudioMixer:
             if music_extension_ms < 0:
                 raise ValueError("music_extension_ms cannot be negative")
             
-            def _merge_sync() -> io.BytesIO:
-                speech = self._load_audio_segment(speech_buffer, speech_format, "speech")
-                music = self._load_audio_segment(music_buffer, music_format, "music")
-                
-                logger.info("Audio loaded for merging",
-                           speech_duration_ms=len(speech),
-                           music_duration_ms=len(music),
-                           operation_id=operation_id)
-                
-                speech_duration = len(speech)
-                desired_music_duration = speech_duration + music_extension_ms
-                
-                if len(music) < desired_music_duration:
-                    repetitions = (desired_music_duration // len(music)) + 1
-                    logger.info("Extending music by repetition",
-                               original_duration=len(music),
-                               repetitions=repetitions,
-                               operation_id=operation_id)
-                    music = music * repetitions
-                
-                music = music[:desired_music_duration]
-                
-                music = music - music_reduction_db
-                
-                # Apply fade out to music
-                actual_fade_duration = min(fade_duration_ms, len(music))
-                if actual_fade_duration > 0:
-                    music = music.fade_out(actual_fade_duration)
-                    logger.debug("Applied fade out",
-                                fade_duration_ms=actual_fade_duration,
-                                operation_id=operation_id)
-                
-                # Overlay speech on music
-                combined = music.overlay(speech, position=0)
-                
-                # Export to buffer
-                buffer = io.BytesIO()
-                combined.export(buffer, format=output_format)
-                buffer.seek(0)
-                
-                logger.info("Audio merged successfully",
-                           final_duration_ms=len(combined),
-                           output_format=output_format,
-                           operation_id=operation_id)
-                
-                return buffer
+            # FFmpeg needs the speech length up front to place the music fade-out.
+            # It decodes the speech itself, so the stream headers are enough here.
+            speech_info = await asyncio.to_thread(self._get_audio_info, speech_buffer, speech_format)
+            speech_duration = speech_info.duration_ms
+            
+            desired_music_duration = speech_duration + music_extension_ms
             
             logger.info("Starting audio merge",
                        speech_format=speech_format,
                        music_format=music_format,
                        output_format=output_format,
                        music_reduction_db=music_reduction_db,
+                       speech_duration_ms=speech_duration,
                        operation_id=operation_id)
             
-            result = await asyncio.to_thread(_merge_sync)
+            # Views over the caller's buffers, so the audio isn't copied to reach FFmpeg
+            with speech_buffer.getbuffer() as speech_data, music_buffer.getbuffer() as music_data:
+                merged = await self._ffmpeg_merge(
+                    speech_data,
+                    music_data,
+                    speech_format,
+                    music_format,
+                    output_format,
+                    desired_music_duration,
+                    music_reduction_db,
+                    min(fade_duration_ms, desired_music_duration)
+                )
+            # BytesIO shares the bytes object instead of copying it
+            result = io.BytesIO(merged)
             
             processing_time = time.time() - start_time
             self.metrics.total_processing_time += processing_time
@@ -326,21 +498,19 @@ class AudioMixer:
                 audio_buffer.seek(0)
                 return audio_buffer
             
-            def _convert_sync() -> io.BytesIO:
-                audio = self._load_audio_segment(audio_buffer, input_format, "audio")
-                
-                buffer = io.BytesIO()
-                audio.export(buffer, format=output_format)
-                buffer.seek(0)
-                
-                return buffer
-            
             logger.info("Converting audio format",
                        from_format=input_format,
                        to_format=output_format,
                        operation_id=operation_id)
             
-            result = await asyncio.to_thread(_convert_sync)
+            converted = await asyncio.get_running_loop().run_in_executor(
+                _get_pool(),
+                _transcode,
+                audio_buffer.getvalue(),
+                self._validate_audio_format(input_format).value,
+                self._validate_audio_format(output_format).value
+            )
+            result = io.BytesIO(converted)
             
             processing_time = time.time() - start_time
             self.metrics.total_processing_time += processing_time
@@ -359,6 +529,22 @@ class AudioMixer:
                         operation_id=operation_id)
             raise AudioProcessingError(f"Failed to convert format: {e}")
     
+    async def convert_format_batch(
+        self,
+        items: List[Tuple[io.BytesIO, str, str]],
+        operation_id: str = None
+    ) -> List[Union[io.BytesIO, BaseException]]:
+        """
+        Convert several (buffer, input_format, output_format) items concurrently.
+        The worker pool bounds how many run at once. Results keep the item order,
+        and a failed item yields its exception instead of failing the batch.
+        """
+        return await asyncio.gather(
+            *(self.convert_format(buffer, input_format, output_format, operation_id)
+              for buffer, input_format, output_format in items),
+            return_exceptions=True
+        )
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get mixer performance metrics"""
         return {
@@ -378,12 +564,11 @@ class AudioMixer:
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check by testing basic functionality"""
         try:
-            test_audio = AudioSegment.silent(duration=1000)  # 1 second
-            test_buffer = io.BytesIO()
-            test_audio.export(test_buffer, format="mp3")
-            test_buffer.seek(0)
+            # pydub writes WAV itself; MP3 would need an ffmpeg/LAME encode
+            format_str = "wav" if AudioFormat.WAV in self.config.enabled_formats else "mp3"
+            test_buffer = io.BytesIO(_health_check_audio(format_str))
             
-            info = await self.get_audio_info(test_buffer, "mp3", "health_check")
+            info = await self.get_audio_info(test_buffer, format_str, "health_check")
             
             return {
                 "status": "healthy",
@@ -3,7 +3,7 @@ from enum import Enum
 from pathlib import Path
 import tempfile
 import time
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from utils.mixer_utils.exceptions import ConfigurationError
 
@@ -17,9 +17,13 @@ class AudioFormat(str, Enum):
     OGG = "ogg"
     AAC = "aac"
 
-@dataclass
+@dataclass(slots=True)
 class MixerMetrics:
-    """Track mixer performance metrics"""
+    """
+    Track mixer performance metrics. Only updated from coroutines on the event
+    loop thread; executor threads and pool workers return results and never
+    touch it, so plain ints need no locking.
+    """
     total_operations: int = 0
     successful_operations: int = 0
     failed_operations: int = 0
@@ -39,7 +43,7 @@ class MixerMetrics:
         return (self.total_processing_time / self.successful_operations) if self.successful_operations > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MixerConfig:
     """Configuration for audio mixer"""
     max_file_size_mb: int = 100
@@ -50,8 +54,12 @@ class MixerConfig:
     supported_formats: List[AudioFormat] = field(default_factory=lambda: list(AudioFormat))
     temp_dir: Optional[Path] = None
     enable_ffmpeg_check: bool = True
+    # Derived from supported_formats for O(1) membership checks
+    enabled_formats: FrozenSet[AudioFormat] = field(init=False, repr=False)
     
     def __post_init__(self):
+        self.enabled_formats = frozenset(self.supported_formats)
+        
         if self.temp_dir is None:
             self.temp_dir = Path(tempfile.gettempdir())
         
@@ -65,7 +73,7 @@ class MixerConfig:
             raise ConfigurationError("default_fade_duration_ms cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInfo:
     """Information about an audio file"""
     duration_ms: int
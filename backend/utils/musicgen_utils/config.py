@@ -1,42 +1,38 @@
-import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 import structlog
 from dotenv import load_dotenv
 
+from utils.config_env import env_field
 from utils.musicgen_utils.dataclasses import ModelVersion, NormalizationStrategy, OutputFormat
+from utils.musicgen_utils.exceptions import ConfigurationError
 
 load_dotenv()
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
+@dataclass(frozen=True, slots=True)
 class MusicGenConfig:
     """Configuration for MusicGen"""
     
-    def __init__(self):
-        self.replicate_token = os.getenv('REPLICATE_API_TOKEN')
-        
-        self.default_model = ModelVersion(os.getenv('MUSICGEN_MODEL', 'stereo-large'))
-        self.max_duration = int(os.getenv('MUSICGEN_MAX_DURATION', '120'))  # seconds
-        self.min_duration = int(os.getenv('MUSICGEN_MIN_DURATION', '5'))   # seconds
-        self.timeout = int(os.getenv('MUSICGEN_TIMEOUT', '300'))           # 5 minutes
-        self.download_timeout = int(os.getenv('MUSICGEN_DOWNLOAD_TIMEOUT', '60'))  # 1 minute
-        
-        self.default_format = OutputFormat(os.getenv('MUSICGEN_FORMAT', 'mp3'))
-        self.default_normalization = NormalizationStrategy(os.getenv('MUSICGEN_NORMALIZATION', 'peak'))
-        
+    replicate_token: Optional[str] = env_field('REPLICATE_API_TOKEN', in_repr=False)
+    
+    default_model: ModelVersion = env_field('MUSICGEN_MODEL', 'stereo-large', ModelVersion)
+    max_duration: int = env_field('MUSICGEN_MAX_DURATION', '120', int)  # seconds
+    min_duration: int = env_field('MUSICGEN_MIN_DURATION', '5', int)   # seconds
+    timeout: int = env_field('MUSICGEN_TIMEOUT', '300', int)           # 5 minutes
+    download_timeout: int = env_field('MUSICGEN_DOWNLOAD_TIMEOUT', '60', int)  # 1 minute
+    max_concurrent_generations: int = env_field('MUSICGEN_MAX_CONCURRENT', '4', int)
+    cache_ttl: int = env_field('MUSICGEN_CACHE_TTL', '86400', int)  # 1 day, 0 disables
+    cache_dir: str = env_field('MUSICGEN_CACHE_DIR', '.cache/musicgen')
+    cache_size_limit: int = env_field('MUSICGEN_CACHE_SIZE_LIMIT', str(1024 ** 3), int)  # 1 GiB on disk
+    cache_max_entry_bytes: int = env_field('MUSICGEN_CACHE_MAX_ENTRY', str(20 * 1024 ** 2), int)  # 20 MiB
+    
+    default_format: OutputFormat = env_field('MUSICGEN_FORMAT', 'mp3', OutputFormat)
+    default_normalization: NormalizationStrategy = env_field('MUSICGEN_NORMALIZATION', 'peak', NormalizationStrategy)
+    
+    def __post_init__(self):
         self._validate_config()
     
     def _validate_config(self):
@@ -44,5 +40,14 @@ class MusicGenConfig:
         if not self.replicate_token:
             logger.warning("REPLICATE_API_TOKEN not set, may cause authentication issues")
         
+        if self.max_concurrent_generations < 1:
+            raise ConfigurationError("MUSICGEN_MAX_CONCURRENT must be at least 1")
+        
         if self.max_duration > 300:  # 5 minutes
             logger.warning("Max duration is very high, may cause timeouts")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> MusicGenConfig:
+    """Read and validate the environment once; every MusicGen client shares the result"""
+    return MusicGenConfig()
@@ -25,9 +25,13 @@ class NormalizationStrategy(str, Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class MusicGenMetrics:
-    """Track MusicGen usage metrics"""
+    """
+    Track MusicGen usage metrics. Only updated from coroutines on the event
+    loop thread (generate_many fans out on the same loop), so plain numbers
+    need no locking.
+    """
     total_generations: int = 0
     successful_generations: int = 0
     failed_generations: int = 0
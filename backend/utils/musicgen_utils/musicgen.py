@@ -1,42 +1,177 @@
+import asyncio
+import hashlib
 import io
-from typing import Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union
 import time
+from types import MappingProxyType
 
+import diskcache
 import httpx
+import orjson
 import replicate
 from replicate.helpers import FileOutput
 from dotenv import load_dotenv
 import tenacity
 import structlog
 
-from utils.musicgen_utils.config import MusicGenConfig
+from utils.musicgen_utils.config import MusicGenConfig, get_config
 from utils.musicgen_utils.dataclasses import ModelVersion, MusicGenMetrics, OutputFormat
 from utils.musicgen_utils.exceptions import DownloadError, GenerationError
 
 load_dotenv()
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
+# Sampling defaults, overridable per call through **generation_params
+_DEFAULT_GENERATION_PARAMS = MappingProxyType({
+    "top_k": 250,
+    "top_p": 0,
+    "temperature": 1.0,
+    "classifier_free_guidance": 3,
+    "continuation": False,
+    "continuation_start": 0,
+    "multi_band_diffusion": False,
+})
+_MODELS_BY_NAME = {model.value: model for model in ModelVersion}
+_FORMATS_BY_NAME = {output_format.value: output_format for output_format in OutputFormat}
+
+# Downloads share one pool so keep-alive connections to Replicate's CDN are
+# reused across generations instead of a new TLS handshake per file
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client(timeout: float) -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # Caps sized so generate_many bursts never queue on the pool; over HTTP/2
+        # concurrent downloads from the CDN mostly share a connection anyway
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=1000,
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(timeout, connect=5.0, write=5.0, pool=5.0),
+            http2=True
+        )
+    return _http_client
+
+
+# Finished tracks keyed by their generation params, so a repeated request skips
+# the ~30 s (and paid) Replicate prediction and the download. They live in a
+# size-capped local disk cache with LRU eviction rather than the shared Redis,
+# where multi-MB tracks would crowd out the small, hot keys.
+_music_cache: Optional[diskcache.Cache] = None
+# Cache keys being generated right now; identical concurrent requests wait on
+# the first one's future instead of paying for their own prediction
+_in_flight: Dict[str, asyncio.Future] = {}
+
+
+def _cache_key(model_id: str, params: Dict[str, Any]) -> str:
+    canonical = orjson.dumps([model_id, params], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten long prompts/URLs for log lines"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Whether a failed generation is worth a second (paid) attempt: Replicate
+    5xx/429s, predictions that failed without a status, and network errors.
+    Client errors and our own bugs fail straight away.
+    """
+    cause = exc.__cause__ if isinstance(exc, GenerationError) else exc
+    if isinstance(cause, replicate.exceptions.ReplicateError):
+        status = getattr(cause, "status", None)
+        return status is None or status == 429 or status >= 500
+    return isinstance(cause, httpx.TransportError)
+
+
+def _get_music_cache(config: MusicGenConfig) -> diskcache.Cache:
+    global _music_cache
+    if _music_cache is None:
+        _music_cache = diskcache.Cache(
+            config.cache_dir,
+            size_limit=config.cache_size_limit,
+            eviction_policy="least-recently-used"
+        )
+    return _music_cache
+
+
+async def _cached_generate(key: str, config: MusicGenConfig, generate) -> bytes:
+    """
+    Return the cached track for `key`, or generate and cache it. Disk errors
+    fall through to `generate()`; oversized tracks aren't cached.
+    """
+    cache = _get_music_cache(config)
+    try:
+        audio_bytes = await asyncio.to_thread(cache.get, key)
+        if audio_bytes is not None:
+            return audio_bytes
+    except Exception as e:
+        logger.warning("Music cache read failed", error=str(e))
+
+    audio_bytes = await generate()
+
+    if len(audio_bytes) <= config.cache_max_entry_bytes:
+        try:
+            await asyncio.to_thread(cache.set, key, audio_bytes, expire=config.cache_ttl)
+        except Exception as e:
+            logger.warning("Music cache write failed", error=str(e))
+
+    return audio_bytes
+
+
+async def _get_or_generate(key: str, config: MusicGenConfig, generate) -> bytes:
+    """Cached track for key, generating it at most once across concurrent callers"""
+    in_flight = _in_flight.get(key)
+    if in_flight is not None:
+        return await asyncio.shield(in_flight)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[key] = future
+    try:
+        audio_bytes = await _cached_generate(key, config, generate)
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.set_exception(GenerationError("Music generation was cancelled"))
+        else:
+            future.set_exception(e)
+        # Mark it retrieved so asyncio doesn't warn when nobody was waiting
+        future.exception()
+        raise
+    else:
+        future.set_result(audio_bytes)
+        return audio_bytes
+    finally:
+        del _in_flight[key]
+
+
+async def close_http_client():
+    """Close the shared download connection pool"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def close_music_clients():
+    """Close the download pool and the track cache"""
+    global _music_cache
+    await close_http_client()
+    if _music_cache is not None:
+        _music_cache.close()
+        _music_cache = None
+
 
 class MusicGen:
     """Production-ready MusicGen client"""
 
     def __init__(self, config: Optional[MusicGenConfig] = None):
-        self.config = config or MusicGenConfig()
+        self.config = config or get_config()
         self.model_id = "meta/musicgen:671ac645ce5e552cc63a54a2bbff63fcf798043055d2dac5fc9e36a837eedcfb"
         self.metrics = MusicGenMetrics()
         
@@ -76,6 +211,14 @@ class MusicGen:
         
         return duration
 
+    @staticmethod
+    def _lookup(options: Dict[str, Any], name: str, kind: str):
+        """Resolve a user-supplied enum value from a prebuilt name -> member dict"""
+        member = options.get(name.lower())
+        if member is None:
+            raise ValueError(f"Unknown {kind}: {name}")
+        return member
+
     def _build_generation_params(
         self, 
         prompt: str, 
@@ -95,14 +238,8 @@ class MusicGen:
             "model_version": model_version.value,
             "output_format": output_format.value,
             "normalization_strategy": self.config.default_normalization.value,
-            
-            "top_k": kwargs.get("top_k", 250),
-            "top_p": kwargs.get("top_p", 0),
-            "temperature": kwargs.get("temperature", 1.0),
-            "classifier_free_guidance": kwargs.get("classifier_free_guidance", 3),
-            "continuation": kwargs.get("continuation", False),
-            "continuation_start": kwargs.get("continuation_start", 0),
-            "multi_band_diffusion": kwargs.get("multi_band_diffusion", False),
+            **_DEFAULT_GENERATION_PARAMS,
+            **{key: value for key, value in kwargs.items() if key in _DEFAULT_GENERATION_PARAMS}
         }
         
         if not (0.0 <= params["temperature"] <= 2.0):
@@ -120,13 +257,13 @@ class MusicGen:
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(2),  # Only retry once for expensive operations
         wait=tenacity.wait_exponential(multiplier=2, min=5, max=30),
-        retry=tenacity.retry_if_exception_type((replicate.exceptions.ReplicateError, Exception)),
+        retry=tenacity.retry_if_exception(_is_transient),
         reraise=True
     )
     async def _generate_music(self, params: Dict[str, Any], request_id: str = None) -> str:
         """Generate music using Replicate API with retry logic"""
         logger.info("Starting music generation", 
-                   prompt=params["prompt"][:50] + "..." if len(params["prompt"]) > 50 else params["prompt"],
+                   prompt=_truncate(params["prompt"], 50),
                    duration=params["duration"],
                    model=params["model_version"],
                    request_id=request_id)
@@ -147,17 +284,17 @@ class MusicGen:
                 raise GenerationError(f"Unexpected output type: {type(output)}")
             
             logger.info("Music generation completed", 
-                       output_url=output[:100] + "..." if len(output) > 100 else output,
+                       output_url=_truncate(output, 100),
                        request_id=request_id)
             
             return output
             
         except replicate.exceptions.ReplicateError as e:
             logger.error("Replicate API error", error=str(e), request_id=request_id)
-            raise GenerationError(f"Replicate API error: {e}")
+            raise GenerationError(f"Replicate API error: {e}") from e
         except Exception as e:
             logger.error("Unexpected generation error", error=str(e), request_id=request_id)
-            raise GenerationError(f"Music generation failed: {e}")
+            raise GenerationError(f"Music generation failed: {e}") from e
 
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(3),
@@ -167,11 +304,13 @@ class MusicGen:
     )
     async def _download_audio(self, url: str, request_id: str = None) -> io.BytesIO:
         """Download generated audio with retry logic"""
-        logger.info("Downloading generated audio", url=url[:100] + "...", request_id=request_id)
+        logger.info("Downloading generated audio", url=_truncate(url, 100), request_id=request_id)
         
         try:
-            async with httpx.AsyncClient(timeout=self.config.download_timeout) as client:
-                response = await client.get(url)
+            audio_buffer = io.BytesIO()
+            # Streamed into the buffer as it arrives rather than held as
+            # response.content and then copied into a BytesIO
+            async with _get_http_client(self.config.download_timeout).stream("GET", url) as response:
                 response.raise_for_status()
                 
                 content_type = response.headers.get("content-type", "")
@@ -180,24 +319,26 @@ class MusicGen:
                                  content_type=content_type, 
                                  request_id=request_id)
                 
-                content_length = len(response.content)
-                if content_length == 0:
-                    raise DownloadError("Downloaded file is empty")
-                
-                if content_length < 1000:  # Less than 1KB is suspicious
-                    logger.warning("Downloaded file is very small", 
-                                 size_bytes=content_length, 
-                                 request_id=request_id)
-                
-                audio_buffer = io.BytesIO(response.content)
-                audio_buffer.seek(0)
-                
-                logger.info("Audio download completed", 
-                           size_bytes=content_length,
-                           request_id=request_id)
-                
-                return audio_buffer
-                
+                async for chunk in response.aiter_bytes(chunk_size=256 * 1024):
+                    audio_buffer.write(chunk)
+            
+            content_length = audio_buffer.tell()
+            if content_length == 0:
+                raise DownloadError("Downloaded file is empty")
+            
+            if content_length < 1000:  # Less than 1KB is suspicious
+                logger.warning("Downloaded file is very small", 
+                             size_bytes=content_length, 
+                             request_id=request_id)
+            
+            audio_buffer.seek(0)
+            
+            logger.info("Audio download completed", 
+                       size_bytes=content_length,
+                       request_id=request_id)
+            
+            return audio_buffer
+            
         except httpx.HTTPStatusError as e:
             logger.error("HTTP error downloading audio", 
                         status_code=e.response.status_code,
@@ -221,6 +362,7 @@ class MusicGen:
         model_version: Optional[Union[ModelVersion, str]] = None,
         output_format: Optional[Union[OutputFormat, str]] = None,
         request_id: str = None,
+        use_cache: bool = True,
         **generation_params
     ) -> Optional[io.BytesIO]:
         """
@@ -232,6 +374,7 @@ class MusicGen:
             model_version: MusicGen model to use
             output_format: Audio format (mp3/wav)
             request_id: Optional request ID for tracking
+            use_cache: Reuse a cached track generated with the same parameters
             **generation_params: Additional generation parameters
         
         Returns:
@@ -245,9 +388,9 @@ class MusicGen:
             duration = self._validate_duration(duration)
             
             if isinstance(model_version, str):
-                model_version = ModelVersion(model_version.lower())
+                model_version = self._lookup(_MODELS_BY_NAME, model_version, "model version")
             if isinstance(output_format, str):
-                output_format = OutputFormat(output_format.lower())
+                output_format = self._lookup(_FORMATS_BY_NAME, output_format, "output format")
             
             params = self._build_generation_params(
                 prompt=prompt,
@@ -257,26 +400,40 @@ class MusicGen:
                 **generation_params
             )
             
-            generation_start = time.time()
-            output_url = await self._generate_music(params, request_id)
-            generation_time = time.time() - generation_start
-            self.metrics.total_generation_time += generation_time
+            timings: Dict[str, float] = {}
+            
+            async def generate() -> bytes:
+                generation_start = time.time()
+                output_url = await self._generate_music(params, request_id)
+                timings["generation_time"] = time.time() - generation_start
+                self.metrics.total_generation_time += timings["generation_time"]
+                
+                download_start = time.time()
+                downloaded = await self._download_audio(output_url, request_id)
+                timings["download_time"] = time.time() - download_start
+                self.metrics.total_download_time += timings["download_time"]
+                
+                return downloaded.getvalue()
             
-            download_start = time.time()
-            audio_buffer = await self._download_audio(output_url, request_id)
-            download_time = time.time() - download_start
-            self.metrics.total_download_time += download_time
+            if use_cache and self.config.cache_ttl > 0:
+                audio_bytes = await _get_or_generate(
+                    _cache_key(self.model_id, params), self.config, generate
+                )
+            else:
+                audio_bytes = await generate()
+            audio_buffer = io.BytesIO(audio_bytes)
             
             self.metrics.successful_generations += 1
             total_time = time.time() - start_time
             
             logger.info("Music generation successful",
-                       prompt=prompt[:50] + "..." if len(prompt) > 50 else prompt,
+                       prompt=_truncate(prompt, 50),
                        duration=duration,
-                       generation_time=generation_time,
-                       download_time=download_time,
+                       cache_hit=not timings,
+                       generation_time=timings.get("generation_time"),
+                       download_time=timings.get("download_time"),
                        total_time=total_time,
-                       audio_size=len(audio_buffer.getvalue()),
+                       audio_size=audio_buffer.getbuffer().nbytes,
                        request_id=request_id)
             
             return audio_buffer
@@ -307,6 +464,28 @@ class MusicGen:
                         request_id=request_id)
             return None
 
+    async def generate_many(
+        self,
+        prompts: List[str],
+        **kwargs
+    ) -> List[Union[Optional[io.BytesIO], BaseException]]:
+        """
+        Generate background music for several prompts concurrently, at most
+        max_concurrent_generations at a time; Replicate runs them in parallel.
+        Results keep the prompt order and take the same keyword arguments as
+        generate_background_music.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_generations)
+        
+        async def bounded(prompt: str) -> Optional[io.BytesIO]:
+            async with semaphore:
+                return await self.generate_background_music(prompt, **kwargs)
+        
+        return await asyncio.gather(
+            *(bounded(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get generation metrics"""
         return {
@@ -327,7 +506,8 @@ class MusicGen:
             result = await self.generate_background_music(
                 prompt=test_prompt,
                 duration=self.config.min_duration,
-                request_id="health-check"
+                request_id="health-check",
+                use_cache=False
             )
             
             return {
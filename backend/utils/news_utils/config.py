@@ -1,21 +1,25 @@
-import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 
+from utils.config_env import env_field
 from utils.news_utils.exceptions import ConfigurationError
 
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class NewsAPIConfig:
     """Configuration for NewsAPI"""
     
-    def __init__(self):
-        self.api_key = os.getenv('SERPER_API_KEY')
-        self.base_url = os.getenv('SERPER_BASE_URL', 'https://google.serper.dev/news')
-        self.timeout = int(os.getenv('NEWS_TIMEOUT', '30'))
-        self.max_retries = int(os.getenv('NEWS_MAX_RETRIES', '3'))
-        self.max_articles_per_query = int(os.getenv('NEWS_MAX_ARTICLES', '3'))
-        self.max_concurrent_queries = int(os.getenv('NEWS_MAX_CONCURRENT', '10'))
-        
+    api_key: Optional[str] = env_field('SERPER_API_KEY', in_repr=False)
+    base_url: str = env_field('SERPER_BASE_URL', 'https://google.serper.dev/news')
+    timeout: int = env_field('NEWS_TIMEOUT', '30', int)
+    max_retries: int = env_field('NEWS_MAX_RETRIES', '3', int)
+    max_articles_per_query: int = env_field('NEWS_MAX_ARTICLES', '3', int)
+    max_concurrent_queries: int = env_field('NEWS_MAX_CONCURRENT', '10', int)
+    
+    def __post_init__(self):
         self._validate_config()
     
     def _validate_config(self):
@@ -31,3 +35,9 @@ class NewsAPIConfig:
         
         if self.max_concurrent_queries <= 0:
             raise ConfigurationError("Max concurrent queries must be positive")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> NewsAPIConfig:
+    """Read and validate the environment once; every news client shares the result"""
+    return NewsAPIConfig()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 import time
 
-@dataclass
+@dataclass(slots=True)
 class NewsMetrics:
     """Track news API usage metrics"""
     total_requests: int = 0
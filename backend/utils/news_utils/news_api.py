@@ -10,7 +10,7 @@ from dotenv import load_dotenv
 import structlog
 
 from schemas.news_api_schemas import NewsArticle, NewsResponse
-from utils.news_utils.config import NewsAPIConfig
+from utils.news_utils.config import NewsAPIConfig, get_config
 from utils.news_utils.dataclasses import NewsMetrics
 from utils.news_utils.exceptions import (
     APIQuotaExceededError, 
@@ -21,29 +21,17 @@ from utils.news_utils.exceptions import (
 
 load_dotenv()
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
 class NewsAPI:
     """Production-ready News API client"""
 
-    def __init__(self, config: Optional[NewsAPIConfig] = None):
-        self.config = config or NewsAPIConfig()
+    def __init__(self, config: Optional[NewsAPIConfig] = None, client: Optional[httpx.AsyncClient] = None):
+        self.config = config or get_config()
         self.metrics = NewsMetrics()
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        # An injected client belongs to the caller and is left open on exit
+        self._owns_client = client is None
         self._semaphore = asyncio.Semaphore(self.config.max_concurrent_queries)
         
         logger.info("NewsAPI initialized", 
@@ -62,7 +50,7 @@ class NewsAPI:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Properly close HTTP client when exiting context"""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -217,14 +205,17 @@ class NewsAPI:
             
             try:
                 title = item.get('title', '').strip()
-                if not title:
+                if not title or len(title) > 500:
                     continue
                 
                 snippet = item.get('snippet', '').strip()
                 if not snippet:
                     snippet = None
+                elif len(snippet) > 1000:
+                    continue
                 
-                article = NewsArticle(
+                # Fields are already cleaned and bounds-checked above
+                article = NewsArticle.model_construct(
                     title=title,
                     snippet=snippet
                 )
@@ -440,9 +431,9 @@ class NewsAPI:
 
 
 @asynccontextmanager
-async def create_news_api(config: NewsAPIConfig = None):
+async def create_news_api(config: NewsAPIConfig = None, client: Optional[httpx.AsyncClient] = None):
     """Context manager for NewsAPI with proper resource management"""
-    api = NewsAPI(config=config)
+    api = NewsAPI(config=config, client=client)
     try:
         async with api:
             yield api
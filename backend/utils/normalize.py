@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+# Country names come from a small fixed set, so each canonical form is built
+# once and then reused on every ad
+
+@lru_cache(maxsize=512)
+def norm_country(country: str) -> str:
+    """Canonical country name, e.g. ' united states' -> 'United States'."""
+    return country.strip().title()
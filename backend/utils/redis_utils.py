@@ -3,17 +3,33 @@ import logging
 import os
 import secrets
 import string
+import msgpack
 from redis.asyncio import Redis
 from dotenv import load_dotenv
-from typing import Literal, Optional, List, Dict
+from typing import Any, Awaitable, Callable, Literal, Optional, List, Dict
 from contextlib import asynccontextmanager
 import time
 
 load_dotenv()
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# KEYS[1] = slots set, KEYS[2] = reservations zset, KEYS[3] = reservation key
+# ARGV = now, max_slots, reservation id, reservation data, reservation ttl
+# Outstanding reservations (scored by expiry) count against max_slots
+# alongside acquired slots, so concurrent callers can't over-reserve the pool.
+RESERVE_SLOT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[5])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+if redis.call('SCARD', KEYS[1]) + redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[2], now + ttl, ARGV[3])
+redis.call('SET', KEYS[3], ARGV[4], 'EX', ttl)
+return 1
+"""
+
 
 class VoiceSlotManager:
     def __init__(self, max_slots: int = 4, slot_ttl: int = 3600):
@@ -21,8 +37,10 @@ class VoiceSlotManager:
         self.slot_ttl = slot_ttl
         self.client: Optional[Redis] = None
         self.slots_key = "voice_slots"
+        self.reservations_key = "voice_reservations"
         self.slot_prefix = "voice_slot:"
         self._connection_pool = None
+        self._reserve_script = None
 
     async def initialize(self):
         """Initialize Redis connection with connection pooling"""
@@ -34,7 +52,7 @@ class VoiceSlotManager:
             self.client = await Redis.from_url(
                 redis_url,
                 decode_responses=True,
-                max_connections=20,
+                max_connections=50,
                 retry_on_timeout=True,
                 health_check_interval=30
             )
@@ -53,16 +71,12 @@ class VoiceSlotManager:
             await self.client.close()
 
     async def _ensure_connection(self):
-        """Ensure Redis connection is active"""
+        """
+        Ensure a Redis client exists. Dropped connections are handled by the pool
+        (health_check_interval/retry_on_timeout), so no PING round-trip per call.
+        """
         if not self.client:
             await self.initialize()
-            return
-
-        try:
-            await self.client.ping()
-        except Exception as e:
-            logger.warning(f"Redis connection lost, reconnecting: {e}")
-            await self.initialize()
 
     async def has_available_slot(self, reservation_id: Optional[str] = None) -> bool:
         """
@@ -153,6 +167,53 @@ class VoiceSlotManager:
             logger.error(f"Error reserving slot: {e}")
             return None
 
+    async def reserve_slot_atomic(self, reservation_ttl: int = 300) -> Optional[str]:
+        """
+        Reserve a slot in a single round-trip
+        
+        Capacity (acquired slots plus outstanding reservations) is checked and the
+        reservation is written inside one Lua script, so there's no window between
+        check and write. Expired slots are only swept, with one retry, when the
+        pool looks full.
+        
+        Args:
+            reservation_ttl: Reservation expiry time in seconds (default 5 minutes)
+            
+        Returns:
+            str: 8-character reservation ID if successful, None if all slots are taken
+            
+        Raises:
+            RedisError: If the script could not be run
+        """
+        if not self.client:
+            await self.initialize()
+        
+        if self._reserve_script is None:
+            self._reserve_script = self.client.register_script(RESERVE_SLOT_SCRIPT)
+        
+        reservation_id = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(8))
+        now = int(time.time())
+        reservation_data = {
+            "reservation_id": reservation_id,
+            "created_at": now,
+            "expires_at": now + reservation_ttl
+        }
+        
+        keys = [self.slots_key, self.reservations_key, f"reservation:{reservation_id}"]
+        args = [now, self.max_slots, reservation_id, json.dumps(reservation_data), reservation_ttl]
+        
+        reserved = await self._reserve_script(keys=keys, args=args)
+        if not reserved:
+            # Slots whose keys expired stay in the set until swept, so sweep and retry once
+            await self._cleanup_expired_slots()
+            reserved = await self._reserve_script(keys=keys, args=args)
+        
+        if not reserved:
+            return None
+        
+        logger.info(f"Created reservation: {reservation_id}")
+        return reservation_id
+
     @asynccontextmanager
     async def acquire_slot_with_reservation(self, voice_id: str, reservation_id: str, timeout: int = 30):
         """
@@ -230,6 +291,7 @@ class VoiceSlotManager:
                     pipe.multi()
                     pipe.sadd(self.slots_key, voice_id)
                     pipe.delete(reservation_key)  # Consume the reservation
+                    pipe.zrem(self.reservations_key, reservation_id)
                     
                     # Set slot data with TTL
                     slot_data = {
@@ -381,4 +443,112 @@ class VoiceSlotManager:
             await self._release_slot(voice_id)
             logger.info(f"Force released slot: {voice_id}")
         except Exception as e:
-            logger.error(f"Error force releasing slot: {e}")
\ No newline at end of file
+            logger.error(f"Error force releasing slot: {e}")
+
+class SentenceCache:
+    def __init__(self, ttl: int = 60 * 60 * 24 * 30):
+        self.ttl = ttl
+        self.client: Optional[Redis] = None
+        self.key_prefix = "sentences:translated:"
+
+    async def initialize(self):
+        """Initialize Redis connection"""
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            raise ValueError("REDIS_URL environment variable not set")
+
+        self.client = await Redis.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=10,
+            retry_on_timeout=True,
+            health_check_interval=30
+        )
+
+    async def close(self):
+        """Clean up Redis connection"""
+        if self.client:
+            await self.client.close()
+
+    async def get_sentences(self, language: str) -> Optional[List[str]]:
+        """Get the cached translation of the training corpus for a language"""
+        try:
+            if not self.client:
+                await self.initialize()
+
+            data = await self.client.get(f"{self.key_prefix}{language}")
+            return json.loads(data) if data else None
+
+        except Exception as e:
+            logger.error(f"Error reading translated sentences for {language}: {e}")
+            return None
+
+    async def set_sentences(self, language: str, sentences: List[str]):
+        """Cache the translated training corpus for a language"""
+        try:
+            if not self.client:
+                await self.initialize()
+
+            await self.client.setex(
+                f"{self.key_prefix}{language}",
+                self.ttl,
+                json.dumps(sentences)
+            )
+
+        except Exception as e:
+            logger.error(f"Error caching translated sentences for {language}: {e}")
+
+
+class RedisTTLCache:
+    def __init__(self, prefix: str = "cache:"):
+        self.prefix = prefix
+        self.client: Optional[Redis] = None
+
+    async def initialize(self):
+        """Initialize Redis connection (binary, since values are msgpack blobs)"""
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            raise ValueError("REDIS_URL environment variable not set")
+
+        self.client = await Redis.from_url(
+            redis_url,
+            max_connections=10,
+            retry_on_timeout=True,
+            health_check_interval=30
+        )
+
+    async def close(self):
+        """Clean up Redis connection"""
+        if self.client:
+            await self.client.close()
+
+    async def get_or_set(self, key: str, ttl: int, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, or await `factory()` and cache its result
+        for `ttl` seconds. Empty results aren't cached so failures get retried.
+        Redis errors fall through to `factory()`.
+        """
+        cache_key = f"{self.prefix}{key}"
+        try:
+            if not self.client:
+                await self.initialize()
+
+            data = await self.client.get(cache_key)
+            if data is not None:
+                return msgpack.unpackb(data, raw=False)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {cache_key}: {e}")
+
+        value = await factory()
+
+        if value:
+            try:
+                await self.client.setex(cache_key, ttl, msgpack.packb(value, use_bin_type=True))
+            except Exception as e:
+                logger.warning(f"Cache write failed for {cache_key}: {e}")
+
+        return value
+
+
+# One manager (and so one connection pool) shared by the clone routes and every ad
+slot_manager = VoiceSlotManager()
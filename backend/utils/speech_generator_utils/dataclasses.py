@@ -24,7 +24,7 @@ class VoiceType(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechMetrics:
     """Track speech generation metrics"""
     total_generations: int = 0
@@ -1,4 +1,6 @@
 import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Any, Dict, List
 from elevenlabs import ForcedAlignmentWordResponseModel
 
@@ -35,10 +37,14 @@ async def map_timestamps_to_transcript(
     
     # Create the full aligned text by concatenating all aligned words
     aligned_text = ''.join(word.text for word in aligned_words)
+
+    # Character offsets of every word, computed once so each sentence's words
+    # can be found with a binary search instead of rescanning every word
+    word_ends = list(accumulate(len(word.text) for word in aligned_words))
+    word_starts = [end - len(word.text) for end, word in zip(word_ends, aligned_words)]
     
     result = []
     aligned_pos = 0  # Current position in aligned_text
-    word_idx = 0     # Current word index in aligned_words
     
     for sentence in sentences:
         # Find where this sentence starts in the aligned text
@@ -48,25 +54,12 @@ async def map_timestamps_to_transcript(
             
         sentence_end_pos = sentence_start_pos + len(sentence)
         
-        # Find the word indices that correspond to this sentence
-        start_word_idx = None
-        end_word_idx = None
-        current_pos = 0
-        
-        for i, word in enumerate(aligned_words):
-            word_start = current_pos
-            word_end = current_pos + len(word.text)
-            
-            # Check if this word overlaps with our sentence
-            if (word_start < sentence_end_pos and word_end > sentence_start_pos):
-                if start_word_idx is None:
-                    start_word_idx = i
-                end_word_idx = i
-            
-            current_pos = word_end
+        # First word ending after the sentence starts, last word starting before it ends
+        start_word_idx = bisect_right(word_ends, sentence_start_pos)
+        end_word_idx = bisect_left(word_starts, sentence_end_pos) - 1
         
         # Add the sentence with its timestamps
-        if start_word_idx is not None and end_word_idx is not None:
+        if start_word_idx <= end_word_idx:
             result.append({
                 "text": sentence,
                 "start": aligned_words[start_word_idx].start,
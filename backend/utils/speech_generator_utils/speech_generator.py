@@ -5,10 +5,11 @@ import os
 import uuid
 import time
 from contextlib import asynccontextmanager
-from typing import Dict, List, Literal, Optional, Any, Union
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional, Any, Union
 import sys
 
 from dotenv import load_dotenv
+import httpx
 from elevenlabs import AddVoiceIvcResponseModel, ForcedAlignmentResponseModel, Voice
 from elevenlabs.client import AsyncElevenLabs
 from elevenlabs.core import ApiError
@@ -28,22 +29,30 @@ from utils.speech_generator_utils.exceptions import (
 
 load_dotenv()
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
+# One connection pool shared by every SpeechGenerator so ElevenLabs calls reuse
+# keep-alive connections instead of paying a TLS handshake per context
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client(timeout: float) -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=httpx.Timeout(timeout, connect=5.0)
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared ElevenLabs connection pool"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class SpeechGenerator:
     """Production-ready Speech Generator client"""
@@ -62,7 +71,8 @@ class SpeechGenerator:
         if self._client is None:
             self._client = AsyncElevenLabs(
                 api_key=self.config.api_key,
-                timeout=self.config.request_timeout
+                timeout=self.config.request_timeout,
+                httpx_client=_get_http_client(self.config.request_timeout)
             )
         return self
 
@@ -133,80 +143,94 @@ class SpeechGenerator:
                 description="Data formatting error"
             )
 
+    def _build_speech_request(self, request: Union[SpeechRequest, dict, str]) -> SpeechRequest:
+        """Normalize the accepted request shapes into a SpeechRequest"""
+        if isinstance(request, str):
+            return SpeechRequest(
+                text=request,
+                voice_id=os.getenv('ELEVENLABS_DEFAULT_VOICE_ID', 'pNInz6obpgDQGcFmaJgB')
+            )
+        elif isinstance(request, dict):
+            return SpeechRequest(**request)
+        elif isinstance(request, SpeechRequest):
+            return request
+        raise ValueError("Invalid request format")
+
+    async def generate_speech_stream(
+        self,
+        request: Union[SpeechRequest, dict, str],
+        output_format: Optional[OutputFormat] = None,
+        request_id: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield audio chunks from ElevenLabs' streaming endpoint as they're produced"""
+        speech_request = self._build_speech_request(request)
+        output_format = output_format or self.config.default_output_format
+        
+        logger.info("Generating speech", 
+                   text_length=len(speech_request.text),
+                   voice_id=speech_request.voice_id,
+                   speed=speech_request.speed,
+                   output_format=output_format.value,
+                   request_id=request_id)
+        
+        client = self._get_client()
+        
+        voice_settings = {"speed": speech_request.speed}
+        if speech_request.stability is not None:
+            voice_settings["stability"] = speech_request.stability
+        if speech_request.similarity_boost is not None:
+            voice_settings["similarity_boost"] = speech_request.similarity_boost
+        if speech_request.style is not None:
+            voice_settings["style"] = speech_request.style
+        
+        audio_stream = client.text_to_speech.stream(
+            text=speech_request.text,
+            voice_id=speech_request.voice_id,
+            model_id=self.config.model,
+            output_format=output_format.value,
+            voice_settings=voice_settings,
+        )
+
+        chunk_count = 0
+        async for chunk in audio_stream:
+            chunk_count += 1
+            if chunk_count > 10000:
+                logger.warning("Too many audio chunks, possible streaming issue")
+                break
+            yield chunk
+
     async def generate_speech(
         self, 
         request: Union[SpeechRequest, dict, str],
         output_format: Optional[OutputFormat] = None,
-        request_id: Optional[str] = None
+        request_id: Optional[str] = None,
+        on_chunk: Optional[Callable[[bytes], Awaitable[None]]] = None
     ) -> Optional[io.BytesIO]:
-        """Generate speech with comprehensive error handling and validation"""
+        """
+        Generate speech with comprehensive error handling and validation.
+        `on_chunk` is awaited with each audio chunk as it streams in, so callers
+        can forward it before the whole clip is done.
+        """
         start_time = time.time()
         self.metrics.total_generations += 1
         
         try:
-            if isinstance(request, str):
-                speech_request = SpeechRequest(
-                    text=request,
-                    voice_id=os.getenv('ELEVENLABS_DEFAULT_VOICE_ID', 'pNInz6obpgDQGcFmaJgB')
-                )
-            elif isinstance(request, dict):
-                speech_request = SpeechRequest(**request)
-            elif isinstance(request, SpeechRequest):
-                speech_request = request
-            else:
-                raise ValueError("Invalid request format")
-            
-            output_format = output_format or self.config.default_output_format
-            
-            logger.info("Generating speech", 
-                       text_length=len(speech_request.text),
-                       voice_id=speech_request.voice_id,
-                       speed=speech_request.speed,
-                       output_format=output_format.value,
-                       request_id=request_id)
-            
-            client = self._get_client()
-            
-            voice_settings = {"speed": speech_request.speed}
-            if speech_request.stability is not None:
-                voice_settings["stability"] = speech_request.stability
-            if speech_request.similarity_boost is not None:
-                voice_settings["similarity_boost"] = speech_request.similarity_boost
-            if speech_request.style is not None:
-                voice_settings["style"] = speech_request.style
-            
-            audio_stream = client.text_to_speech.convert(
-                text=speech_request.text,
-                voice_id=speech_request.voice_id,
-                model_id=self.config.model,
-                output_format=output_format.value,
-                voice_settings=voice_settings,
-            )
-
-            audio_chunks = []
+            audio_io = io.BytesIO()
             chunk_count = 0
             
-            async for chunk in audio_stream:
-                audio_chunks.append(chunk)
+            # Chunks are written as they stream in rather than joined at the end
+            async for chunk in self.generate_speech_stream(request, output_format, request_id):
+                audio_io.write(chunk)
                 chunk_count += 1
-                    
-                if chunk_count > 10000:
-                    logger.warning("Too many audio chunks, possible streaming issue")
-                    break
+                if on_chunk:
+                    await on_chunk(chunk)
             
-            if not audio_chunks:
+            audio_size = audio_io.tell()
+            if audio_size == 0:
                 logger.error("No audio data received", request_id=request_id)
                 self.metrics.failed_generations += 1
                 return None
             
-            audio_bytes = b"".join(audio_chunks)
-            
-            if len(audio_bytes) == 0:
-                logger.error("Empty audio data", request_id=request_id)
-                self.metrics.failed_generations += 1
-                return None
-            
-            audio_io = io.BytesIO(audio_bytes)
             audio_io.seek(0)
             
             generation_time = time.time() - start_time
@@ -214,9 +238,9 @@ class SpeechGenerator:
             self.metrics.total_generation_time += generation_time
             
             logger.info("Speech generation successful",
-                       audio_size_bytes=len(audio_bytes),
+                       audio_size_bytes=audio_size,
                        generation_time=generation_time,
-                       chunks=len(audio_chunks),
+                       chunks=chunk_count,
                        request_id=request_id)
             
             return audio_io
@@ -12,7 +12,7 @@ class FilterType(str, Enum):
     TV_SHOW = "tv_show"
     BRAND = "brand"
 
-@dataclass
+@dataclass(slots=True)
 class APIMetrics:
     """Track API usage metrics"""
     total_requests: int = 0
@@ -18,30 +18,23 @@ from utils.taste_api_utils.exceptions import RateLimitError, TasteAPIError, Conf
 
 load_dotenv()
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
 class TasteAPI:
     """Production-ready TasteAPI client"""
     
-    def __init__(self, location: Optional[str] = None, config: Optional[TasteAPIConfig] = None):
+    def __init__(
+        self, 
+        location: Optional[str] = None, 
+        config: Optional[TasteAPIConfig] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.config = config or TasteAPIConfig()
         self.location = location or os.getenv('DEFAULT_LOCATION', 'Nigeria')
         self.metrics = APIMetrics()
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        # An injected client belongs to the caller and is left open on exit
+        self._owns_client = client is None
         self._limiter = AsyncLimiter(
             max_rate=self.config.max_rate, 
             time_period=self.config.time_period
@@ -64,7 +57,7 @@ class TasteAPI:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Properly close HTTP client when exiting context"""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -155,14 +148,14 @@ class TasteAPI:
                 
             try:
                 name = item.get('name', '').strip()
-                if not name:
+                if not name or len(name) > 200:
                     continue
                 
                 tags = []
                 if 'tags' in item and isinstance(item['tags'], list):
                     tags = [
                         tag.get('name', '').strip() 
-                        for tag in item['tags'][:self.config.max_tags]
+                        for tag in item['tags'][:min(self.config.max_tags, 10)]
                         if isinstance(tag, dict) and tag.get('name', '').strip()
                     ]
                 
@@ -175,7 +168,8 @@ class TasteAPI:
                     except (ValueError, TypeError):
                         popularity = None
                 
-                recommendation = RecommendationItem(
+                # Fields are already cleaned and bounds-checked above
+                recommendation = RecommendationItem.model_construct(
                     name=name,
                     tags=tags,
                     popularity=popularity
@@ -316,9 +310,13 @@ class TasteAPI:
 
 
 @asynccontextmanager
-async def create_taste_api(location: str = None, config: TasteAPIConfig = None):
+async def create_taste_api(
+    location: str = None, 
+    config: TasteAPIConfig = None, 
+    client: Optional[httpx.AsyncClient] = None
+):
     """Context manager for TasteAPI with proper resource management"""
-    api = TasteAPI(location=location, config=config)
+    api = TasteAPI(location=location, config=config, client=client)
     try:
         async with api:
             yield api
@@ -10,7 +10,6 @@ from aiolimiter import AsyncLimiter
 
 from schemas.trends_schemas import Topic
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 trends_limiter = AsyncLimiter(max_rate=1, time_period=10)
@@ -166,6 +165,7 @@ class GoogleTrendsScraper:
                     try:
                         if isinstance(trend, list) and len(trend) >= 10:
                             timestamp = trend[3][0] if trend[3] else None
+                            category = trend[10][0] if len(trend) > 10 and trend[10] else None
                             topic = {
                                 'query': trend[0],
                                 'country': trend[2],
@@ -173,7 +173,7 @@ class GoogleTrendsScraper:
                                 'formatted_timestamp': self._format_timestamp(timestamp),
                                 'search_volume': trend[6] if len(trend) > 6 else None,
                                 'related_queries': trend[9] if len(trend) > 9 else [],
-                                'category': trend[10][0] if len(trend) > 10 and trend[10] else None
+                                'category': int(category) if str(category).isdigit() else None
                             }
 
                             parsed_topic = Topic(**topic)
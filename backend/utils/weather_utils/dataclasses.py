@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 import time
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherMetrics:
     """Track weather API usage metrics"""
     total_requests: int = 0
@@ -26,29 +26,17 @@ from utils.weather_utils.helpers import (
 
 load_dotenv()
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 logger = structlog.get_logger(__name__)
 
 class WeatherAPI:
     """Production-ready Weather API client"""
 
-    def __init__(self, config: Optional[WeatherAPIConfig] = None):
+    def __init__(self, config: Optional[WeatherAPIConfig] = None, client: Optional[httpx.AsyncClient] = None):
         self.config = config or WeatherAPIConfig()
         self.metrics = WeatherMetrics()
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        # An injected client belongs to the caller and is left open on exit
+        self._owns_client = client is None
         self._location_cache = LocationCache(self.config.cache_ttl_seconds)
         
         logger.info("WeatherAPI initialized", 
@@ -67,7 +55,7 @@ class WeatherAPI:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Properly close HTTP client when exiting context"""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -96,7 +84,12 @@ class WeatherAPI:
                        location=params.get('q'),
                        request_id=request_id)
             
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(
+                url,
+                params=params,
+                headers={"User-Agent": "WeatherAPI-Client/1.0"},
+                timeout=self.config.timeout
+            )
             
             response_time = time.time() - start_time
             self.metrics.total_response_time += response_time
@@ -213,10 +206,19 @@ class WeatherAPI:
             if not weather_description:
                 weather_description = 'Unknown'
             
-            forecast_data = ForecastData(
+            average_temp = safe_float(data.get('avgtemp_c'))
+            if average_temp is not None and not -50 <= average_temp <= 60:
+                raise ValueError(f"Temperature out of range: {average_temp}")
+            
+            average_humidity = safe_int(data.get('avghumidity'))
+            if average_humidity is not None and not 0 <= average_humidity <= 100:
+                raise ValueError(f"Humidity out of range: {average_humidity}")
+            
+            # Fields are already cleaned and bounds-checked above
+            forecast_data = ForecastData.model_construct(
                 forecast_day=day_label,
-                average_temp_in_celcius=safe_float(data.get('avgtemp_c')),
-                average_humidity=safe_int(data.get('avghumidity')),
+                average_temp_in_celcius=average_temp,
+                average_humidity=average_humidity,
                 weather_description=weather_description
             )
             
@@ -503,9 +505,9 @@ class WeatherAPI:
 
 
 @asynccontextmanager
-async def create_weather_api(config: WeatherAPIConfig = None):
+async def create_weather_api(config: WeatherAPIConfig = None, client: Optional[httpx.AsyncClient] = None):
     """Context manager for WeatherAPI with proper resource management"""
-    api = WeatherAPI(config=config)
+    api = WeatherAPI(config=config, client=client)
     try:
         async with api:
             yield api
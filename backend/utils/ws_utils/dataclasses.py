@@ -8,14 +8,14 @@ class StepStatus(Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     status: StepStatus
     data: Optional[Any] = None
     error: Optional[str] = None
     step_name: str = ""
 
-@dataclass 
+@dataclass(slots=True)
 class AdProcessingState:
     index: int
     location: str
@@ -24,4 +24,11 @@ class AdProcessingState:
     speech: StepResult
     music: StepResult
     merge: StepResult
-    voice_cleanup: StepResult
\ No newline at end of file
+    voice_cleanup: StepResult
+
+@dataclass(slots=True)
+class AdContext:
+    taste_data: Optional[Any] = None
+    trends: List[Any] = field(default_factory=list)
+    forecast_data: Optional[Any] = None
+    slangs: Optional[Any] = None
\ No newline at end of file
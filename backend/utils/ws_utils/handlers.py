@@ -1,19 +1,40 @@
-from typing import Union
+import asyncio
+import logging
+import time
+from typing import Optional, Union
+import httpx
+from pydantic import TypeAdapter
+from schemas.news_api_schemas import NewsResponse
+from schemas.weather_schemas import ForecastData
 from utils.gpt_utils.gpts import create_gpt_client
 from utils.news_utils.news_api import create_news_api
+from utils.redis_utils import RedisTTLCache
 from utils.taste_api_utils.taste_api import create_taste_api
-from utils.trends_scraper import GoogleTrendsScraper
 from utils.weather_utils.weather_api import create_weather_api
+from utils.ws_utils.dataclasses import AdContext
 
+logger = logging.getLogger(__name__)
 
-async def get_insights(location: str):
+# Dump whole result lists in pydantic-core instead of one model_dump() per item
+_NEWS_LIST = TypeAdapter(list[NewsResponse])
+_FORECAST_LIST = TypeAdapter(list[ForecastData])
+
+# Context data barely changes within an hour for a given country, so repeat
+# locations are served from Redis instead of GPT/Qloo/Playwright/weather calls
+context_cache = RedisTTLCache(prefix="context:")
+
+
+async def get_insights(location: str, client: Optional[httpx.AsyncClient] = None):
     """Get taste insights for a location."""
-    async with create_taste_api(location) as taste:
+    async with create_taste_api(location, client=client) as taste:
         taste_data = await taste.get_all_insights()
         return taste_data
         
-async def get_trends(country_code: str):
+async def get_trends(country_code: str, client: Optional[httpx.AsyncClient] = None):
     """Get trending topics and related news for a country."""
+    # Playwright is only loaded once an ad actually needs trends
+    from utils.trends_scraper import GoogleTrendsScraper
+
     async with GoogleTrendsScraper(headless=True) as scraper:
         trends = await scraper.scrape_trending_topics(country_code.upper(), hours=168)
         if not trends:
@@ -24,24 +45,78 @@ async def get_trends(country_code: str):
         query = topic.query
         trends_list.append(query)
 
-    async with create_news_api() as news_api:
+    async with create_news_api(client=client) as news_api:
         news_list = await news_api.get_news_for_query_list(
             trends_list, 
             country_code.lower()
         )
-        return [news.model_dump() for news in news_list]
+        return _NEWS_LIST.dump_python(news_list)
     
-async def get_forecast_info(country_name: str, use_weather: bool, days: Union[str, None] = None):
+async def get_forecast_info(
+    country_name: str, 
+    use_weather: bool, 
+    days: Union[str, None] = None, 
+    client: Optional[httpx.AsyncClient] = None
+):
     """Get weather forecast information if weather is enabled."""
     if not use_weather or not days:
         return None
         
-    async with create_weather_api() as weather_api:
+    async with create_weather_api(client=client) as weather_api:
         forecast_data = await weather_api.get_forecast(country_name, days)
-        return [forecast.model_dump() for forecast in forecast_data]
+        return _FORECAST_LIST.dump_python(forecast_data)
 
 async def get_slangs(country_name: str):
     """Get local slangs for a country."""
     async with create_gpt_client() as gpt:
         slangs = await gpt.get_slangs(country_name)
-        return slangs.model_dump()
\ No newline at end of file
+        return slangs.model_dump()
+
+async def gather_context(
+    location_name: str,
+    location_code: str,
+    use_weather: bool,
+    days: Union[str, None],
+    client: httpx.AsyncClient
+) -> AdContext:
+    """
+    Fetch taste, trends, forecast and slang data for a location concurrently.
+    A failing source is logged and left empty instead of failing the others.
+    """
+    hour_bucket = time.strftime("%Y%m%d%H", time.gmtime())
+    day_bucket = hour_bucket[:8]
+
+    results = await asyncio.gather(
+        context_cache.get_or_set(
+            f"taste:{location_name}:{day_bucket}", 3600,
+            lambda: get_insights(location_name, client)
+        ),
+        context_cache.get_or_set(
+            f"trends:{location_code}:{hour_bucket}", 3600,
+            lambda: get_trends(location_code, client)
+        ),
+        context_cache.get_or_set(
+            f"forecast:{location_name}:{days}:{hour_bucket}", 3600,
+            lambda: get_forecast_info(location_name, use_weather, days, client)
+        ),
+        context_cache.get_or_set(
+            f"slangs:{location_name}:{day_bucket}", 86400,
+            lambda: get_slangs(location_name)
+        ),
+        return_exceptions=True
+    )
+
+    names = ("taste_data", "trends", "forecast_data", "slangs")
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to get {name} for {location_name}: {result}")
+
+    taste_data, trends, forecast_data, slangs = (
+        None if isinstance(result, Exception) else result for result in results
+    )
+    return AdContext(
+        taste_data=taste_data,
+        trends=trends or [],
+        forecast_data=forecast_data,
+        slangs=slangs
+    )
\ No newline at end of file
@@ -1,13 +1,12 @@
-import asyncio
 import logging
 
 from fastapi import WebSocket
 from utils.ws_utils.dataclasses import StepResult, StepStatus, AdProcessingState
-from utils.ws_utils.handlers import get_forecast_info, get_insights, get_slangs, get_trends
+from utils.http_client import get_shared_client
+from utils.ws_utils.handlers import gather_context
 from utils.ws_utils.ws_helpers import safe_send_websocket_message
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -21,14 +20,10 @@ async def step_gather_insights(
 ) -> StepResult:
     """Step 1: Gather all insights data."""
     try:
-        tasks = [
-            asyncio.create_task(get_insights(location_name)),
-            asyncio.create_task(get_trends(location_code)),
-            asyncio.create_task(get_forecast_info(location_name, use_weather, forecast_type)),
-            asyncio.create_task(get_slangs(location_name))
-        ]
-
-        taste_data, trends, forecast_data, slangs = await asyncio.gather(*tasks)
+        context = await gather_context(
+            location_name, location_code, use_weather, forecast_type, get_shared_client()
+        )
+        taste_data = context.taste_data
 
         # Make taste_data optional - log warning but continue processing
         if not taste_data:
@@ -36,9 +31,9 @@ async def step_gather_insights(
 
         insights_data = {
             "taste_data": taste_data or {},  # Use empty dict if None
-            "trends": trends,
-            "forecast_data": forecast_data,
-            "slangs": slangs
+            "trends": context.trends,
+            "forecast_data": context.forecast_data,
+            "slangs": context.slangs
         }
 
         return StepResult(
@@ -7,7 +7,6 @@ from utils.ws_utils.dataclasses import StepResult, StepStatus, AdProcessingState
 from utils.ws_utils.ws_helpers import get_message_bytes, safe_send_websocket_message
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def merge_ad_with_music(
@@ -4,7 +4,6 @@ from utils.speech_generator_utils.speech_generator import create_speech_generato
 from utils.ws_utils.dataclasses import StepResult, StepStatus, AdProcessingState
 from utils.ws_utils.ws_helpers import safe_send_websocket_message
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def step_generate_music(
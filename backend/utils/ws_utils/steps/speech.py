@@ -1,19 +1,43 @@
+import asyncio
+import io
+import itertools
 import logging
 
 from fastapi import WebSocket
 
 from schemas.gpt_schemas import ResponseSchema
 from schemas.speech_generator_schemas import VoiceData, SpeechRequest
-from utils.deepl_utils import translate
 from utils.speech_generator_utils.helpers import map_timestamps_to_transcript
 from utils.speech_generator_utils.speech_generator import create_speech_generator
 from utils.ws_utils.dataclasses import AdProcessingState, StepResult, StepStatus
-from utils.ws_utils.ws_helpers import get_message_bytes, safe_send_websocket_message
+from utils.ws_utils.ws_helpers import get_message_bytes, safe_send_websocket_message, send_websocket_bytes
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Voice language labels that need no translation ('' covers a missing label)
+_ENGLISH = frozenset({"en", "eng", "english", ""})
+
+def _norm_lang(language: str | None) -> str:
+    """Reduce labels like 'EN', 'en-US' or ' English ' to a bare lowercase code."""
+    return (language or "").strip().casefold().split("-")[0]
+
+async def get_sentence_alignment(transcript: str, audio_buffer: io.BytesIO):
+    """Force-align the generated speech and map it onto transcript sentences."""
+    async with create_speech_generator() as labs:
+        forced_alignment = await labs.get_forced_alignment(
+            transcript,
+            audio_buffer
+        )
+
+    if not forced_alignment:
+        return None
+
+    return await map_timestamps_to_transcript(
+        transcript,
+        forced_alignment.words
+    )
+
 async def generate_ad_speech(
     websocket: WebSocket,
     index: int,
@@ -31,45 +55,55 @@ async def generate_ad_speech(
         if language:
             logger.info(f"voice language is present: {language}")
         
-        if language and language != 'en':
+        if english_transcript and _norm_lang(language) not in _ENGLISH:
             logger.info(f"Intializing translation to {language} language")
+            # The DeepL SDK is only needed for non-English voices
+            from utils.deepl_utils import translate
+
             translation = await translate(english_transcript, "EN", language.upper())
             if translation:
                 logger.info(f"Translation Successful")
 
-        async with create_speech_generator() as labs:
-            transcript = translation if translation else english_transcript
+        transcript = translation if translation else english_transcript
+
+        # Forward the speech as ElevenLabs streams it so the client gets audio
+        # early; the complete buffer still feeds alignment and the merge
+        chunk_seq = itertools.count()
 
+        async def send_chunk(chunk: bytes):
+            try:
+                await send_websocket_bytes(websocket, get_message_bytes(
+                    {"type": "speech_chunk", "index": index, "seq": next(chunk_seq)},
+                    chunk
+                ))
+            except Exception as e:
+                logger.warning(f"Failed to send speech chunk for index {index}: {e}")
 
+        async with create_speech_generator() as labs:
             speech_request = SpeechRequest(
                 text=transcript,
                 voice_id=voice_data.voice_id
             )
             audio_buffer = await labs.generate_speech(
-                speech_request
+                speech_request,
+                on_chunk=send_chunk
             )
 
             if not audio_buffer:
                 raise ValueError("Voice generation failed")
 
-            forced_alignment = await labs.get_forced_alignment(
-                transcript,
-                audio_buffer
-            )
-
-        sentence_alignment = None
-        if forced_alignment:
-            sentence_alignment = await map_timestamps_to_transcript(
-                transcript,
-                forced_alignment.words
-            )
+        # Alignment isn't needed for mixing, so let it run alongside the merge step.
+        # It gets its own copy of the audio since the mixer reads the original buffer.
+        alignments_task = asyncio.create_task(
+            get_sentence_alignment(transcript, io.BytesIO(audio_buffer.getvalue()))
+        )
 
         # Return all the data instead of sending via websocket
         return {
             "audio_buffer": audio_buffer,
             "transcript": transcript_data.transcript,
             "translations": translation.split("\n") if translation else None,
-            "alignments": sentence_alignment
+            "alignments_task": alignments_task
         }
         
     except Exception as e:
@@ -100,7 +134,7 @@ async def step_generate_speech(
 
         return StepResult(
             status=StepStatus.SUCCESS,
-            data=speech_data,  # Now contains dict with audio_buffer, transcript, translations, alignments
+            data=speech_data,  # Now contains dict with audio_buffer, transcript, translations, alignments_task
             step_name="speech"
         )
 
@@ -1,25 +1,23 @@
-import json
 import logging
 
 from fastapi import WebSocket
+import orjson
 
 from prompts import transcript_prompts
 from schemas.gpt_schemas import TranscriptRequest
-from schemas.speech_generator_schemas import VoiceData
 from schemas.ws_schemas import AdRequest
 from utils.gpt_utils.gpts import create_gpt_client
 from utils.ws_utils.dataclasses import AdProcessingState, StepResult, StepStatus
 from utils.ws_utils.ws_helpers import safe_send_websocket_message
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def step_generate_transcript(
     websocket: WebSocket,
     state: AdProcessingState,
     data: AdRequest,
-    voices: list[VoiceData],
+    voices_dumped: list[dict],
     insights_data: dict
 ) -> StepResult:
     """Step 2: Generate transcript."""
@@ -32,14 +30,14 @@ async def step_generate_transcript(
                 data.cta,
                 data.locations[state.index].model_dump(),
                 insights_data.get("taste_data", {}),
-                [voice.model_dump() for voice in voices],
+                voices_dumped,
                 insights_data["trends"],
                 insights_data["slangs"],
                 insights_data["forecast_data"],
             )
 
             transcript_request = TranscriptRequest(
-                user_prompt=json.dumps(user_prompt),
+                user_prompt=orjson.dumps(user_prompt).decode(),
                 with_forecast=data.use_weather,
                 forecast_days=data.forecast_type,
                 variations=1
@@ -1,8 +1,12 @@
-import json
+import asyncio
 import logging
 import struct
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
 
 from fastapi import WebSocket
+import orjson
 
 from schemas.speech_generator_schemas import VoiceData
 from utils.redis_utils import VoiceSlotManager
@@ -10,12 +14,10 @@ from utils.speech_generator_utils.speech_generator import create_speech_generato
 from utils.ws_utils.dataclasses import AdProcessingState, StepStatus
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def get_message_bytes(metadata: dict, audio_bytes: bytes) -> bytes:
-    meta_json = json.dumps(metadata)
-    meta_bytes = meta_json.encode('utf-8')
+    meta_bytes = orjson.dumps(metadata)
     meta_length = struct.pack('<I', len(meta_bytes))
     message = meta_length + meta_bytes + audio_bytes
 
@@ -26,22 +28,115 @@ def get_dual_audio_message_bytes(metadata: dict, speech_audio_bytes: bytes, merg
     Create a message with metadata and TWO audio blobs (speech-only and merged).
     Format: [metadata_length][metadata][speech_length][speech_audio][merged_audio]
     """
-    meta_json = json.dumps(metadata)
-    meta_bytes = meta_json.encode('utf-8')
+    meta_bytes = orjson.dumps(metadata)
     meta_length = struct.pack('<I', len(meta_bytes))
     speech_length = struct.pack('<I', len(speech_audio_bytes))
     
     message = meta_length + meta_bytes + speech_length + speech_audio_bytes + merged_audio_bytes
     return message
 
+async def send_json(websocket: WebSocket, message: dict):
+    """Send a JSON text frame, encoded with orjson."""
+    await websocket.send_text(orjson.dumps(message).decode())
+
+class WebSocketCork:
+    """
+    Buffers JSON messages for a websocket and sends them as one frame.
+    Several pending messages go out as {"type": "batch", "messages": [...]}.
+    """
+
+    def __init__(self, websocket: WebSocket, max_delay_ms: int = 10, max_batch: int = 32):
+        self.websocket = websocket
+        self.max_delay = max_delay_ms / 1000
+        self.max_batch = max_batch
+        self._messages: list[dict] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+        # Every frame for this socket goes out under this lock, so a flush started
+        # by the timer can't interleave with a later frame
+        self._send_lock = asyncio.Lock()
+
+    def add(self, message: dict):
+        """Queue a message, flushing once the batch is full or the delay elapses."""
+        self._messages.append(message)
+        if len(self._messages) >= self.max_batch:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._schedule_flush)
+
+    def _schedule_flush(self):
+        task = asyncio.create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> bool:
+        """Send everything queued so far."""
+        async with self._send_lock:
+            return await self._flush_locked()
+
+    async def send_bytes(self, data: bytes):
+        """Send a binary frame after everything queued or already being flushed."""
+        async with self._send_lock:
+            await self._flush_locked()
+            await self.websocket.send_bytes(data)
+
+    async def _flush_locked(self) -> bool:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._messages:
+            return True
+
+        messages, self._messages = self._messages, []
+        payload = messages[0] if len(messages) == 1 else {"type": "batch", "messages": messages}
+        try:
+            await send_json(self.websocket, payload)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send websocket batch: {e}")
+            return False
+
+    async def close(self):
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+
+
+_active_cork: ContextVar[Optional[WebSocketCork]] = ContextVar("active_cork", default=None)
+
+@asynccontextmanager
+async def cork(websocket: WebSocket, max_delay_ms: int = 10, max_batch: int = 32):
+    """Batch JSON messages sent through safe_send_websocket_message inside this block."""
+    ws_cork = WebSocketCork(websocket, max_delay_ms, max_batch)
+    token = _active_cork.set(ws_cork)
+    try:
+        yield ws_cork
+    finally:
+        _active_cork.reset(token)
+        await ws_cork.close()
+
 async def safe_send_websocket_message(websocket: WebSocket, message: dict):
     """Safely send websocket message with connection handling."""
+    ws_cork = _active_cork.get()
+    if ws_cork and ws_cork.websocket is websocket:
+        ws_cork.add(message)
+        return True
+
     try:
-        await websocket.send_json(message)
+        await send_json(websocket, message)
         return True
     except Exception as e:
         logger.error(f"Failed to send websocket message: {e}")
         return False
+
+async def send_websocket_bytes(websocket: WebSocket, data: bytes):
+    """Send a binary frame, flushing any corked JSON first so ordering is kept."""
+    ws_cork = _active_cork.get()
+    if ws_cork and ws_cork.websocket is websocket:
+        await ws_cork.send_bytes(data)
+    else:
+        await websocket.send_bytes(data)
     
 def ensure_voice_data_object(voice_data_source) -> VoiceData:
     """Ensure voice data is a VoiceData object, not a dictionary."""
@@ -57,12 +152,21 @@ async def cleanup_custom_voice(voice_id: str, slot_manager: VoiceSlotManager, st
     """Clean up custom voice and update slot status."""
     try:
         async with create_speech_generator() as labs:
-            deleted = await labs.delete_voice(voice_id)
-            if not deleted:
-                logger.warning(f"Failed to delete voice {voice_id}")
-        
-        await slot_manager.update_slot_status(voice_id, status)
-        logger.info(f"Voice {voice_id} cleaned up with status: {status}")
+            # The ElevenLabs delete and the Redis update are independent, so overlap them
+            deleted, updated = await asyncio.gather(
+                labs.delete_voice(voice_id),
+                slot_manager.update_slot_status(voice_id, status),
+                return_exceptions=True
+            )
+
+        if isinstance(deleted, Exception):
+            logger.warning(f"Failed to delete voice {voice_id}: {deleted}")
+        elif not deleted:
+            logger.warning(f"Failed to delete voice {voice_id}")
+        if isinstance(updated, Exception):
+            logger.error(f"Failed to update slot status for {voice_id}: {updated}")
+        else:
+            logger.info(f"Voice {voice_id} cleaned up with status: {status}")
         
     except Exception as cleanup_error:
         logger.error(f"Error during voice cleanup for {voice_id}: {cleanup_error}")
@@ -30,7 +30,8 @@ export const ResponsePayload = z.object({
         z.literal("fatal_error"),
         z.literal("complete"),
         z.literal("received"),
-        z.literal("audio_complete")  // New combined audio message type
+        z.literal("audio_complete"),  // New combined audio message type
+        z.literal("speech_chunk")  // Partial speech while it's generated; not played yet
     ]),
     message: z.string().optional(),
     index: z.number().optional(),
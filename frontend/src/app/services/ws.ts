@@ -42,6 +42,17 @@ export const wsService = {
 
         const handleJsonMessage = (data: string | Buffer) => {
             const json = JSON.parse(data.toString());
+
+            // The server coalesces messages sent close together into one batch frame
+            if (json.type === "batch" && Array.isArray(json.messages)) {
+                json.messages.forEach(handlePayload);
+                return;
+            }
+
+            handlePayload(json);
+        };
+
+        const handlePayload = (json: any) => {
             const resData = ResponsePayload.parse(json);
             console.log("Received JSON:", json);
 
@@ -131,6 +142,11 @@ export const wsService = {
                 );
                 console.log("Blob Metadata: ", metadata)
 
+                // Streamed speech previews; the ad waits for audio_complete
+                if (metadata.type === "speech_chunk") {
+                    return;
+                }
+
                 const { updateAd, ads } = useAdData.getState();
                 let targetAd = null;
                 